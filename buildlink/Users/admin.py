@@ -1,7 +1,9 @@
 from django.contrib import admin
-from .models import User, NationalID
+from .models import User, NationalID, NationalIDVerificationBatch, VerificationAuditLog
 
 admin.site.register(User)
 admin.site.register(NationalID)
+admin.site.register(NationalIDVerificationBatch)
+admin.site.register(VerificationAuditLog)
 
 # Register your models here.
@@ -0,0 +1,87 @@
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from Users.models import User
+
+# Fields the permission classes and auth checks need. Everything else on the
+# user is deferred and loaded on first access, exactly like .only().
+AUTH_USER_FIELDS = (
+    'id', 'role', 'verified', 'verification_status',
+    'is_active', 'is_staff', 'is_superuser',
+)
+AUTH_USER_CACHE_TTL = 60
+
+
+def auth_user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def invalidate_cached_users(user_ids):
+    """Drop cached auth snapshots, e.g. after a queryset .update()."""
+    cache.delete_many([auth_user_cache_key(user_id) for user_id in user_ids])
+
+
+def auth_cache_enabled():
+    # Invalidation only reaches other processes through a shared cache; a
+    # per-process LocMem copy could keep a stale role or is_active for the
+    # whole TTL, so without one every request reads the database.
+    return not isinstance(caches['default'], LocMemCache)
+
+
+def build_auth_user(values):
+    """Rebuild a User from a cached snapshot without touching the database."""
+    # For a partial row from_db() expects the values in concrete-field order.
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in AUTH_USER_FIELDS]
+    return User.from_db('default', names, [values[name] for name in names])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves request.user from a short-TTL cache.
+
+    On a cache miss only AUTH_USER_FIELDS are loaded. The cached snapshot is
+    dropped whenever the user is saved or deleted (see Users.signals).
+    Caching is skipped unless the default cache is shared between processes.
+
+    Views that serialize or save the whole user set `full_auth_user = True`
+    and get the full row in the one query simplejwt would make, instead of a
+    deferred user plus a second load.
+    """
+
+    def authenticate(self, request):
+        view = request.parser_context.get('view') if request.parser_context else None
+        self.full_user = getattr(view, 'full_auth_user', False)
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN or getattr(self, 'full_user', False):
+            # Revocation needs the password hash, which is never cached.
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        use_cache = auth_cache_enabled()
+        key = auth_user_cache_key(user_id)
+        values = cache.get(key) if use_cache else None
+        if values is None:
+            values = (
+                User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                .values(*AUTH_USER_FIELDS)
+                .first()
+            )
+            if values is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            if use_cache:
+                cache.set(key, values, AUTH_USER_CACHE_TTL)
+
+        user = build_auth_user(values)
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
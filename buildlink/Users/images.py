@@ -0,0 +1,174 @@
+import hashlib
+import http.client
+import io
+import ipaddress
+import socket
+import ssl
+import urllib.parse
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# name -> max width in pixels; height follows the aspect ratio.
+DERIVATIVE_WIDTHS = {
+    'thumb': 320,
+    'medium': 960,
+}
+DERIVATIVE_FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+MAX_SOURCE_BYTES = 15 * 1024 * 1024
+FETCH_TIMEOUT = 10
+MAX_REDIRECTS = 3
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Worth retrying: the network or the remote server failed, not the request.
+RETRYABLE_FETCH_ERRORS = (ConnectionError, TimeoutError, http.client.HTTPException)
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _base_path(digest):
+    return f"portfolio/{digest[:2]}/{digest}"
+
+
+class UnsafeImageURL(ValueError):
+    """The URL is not http(s) or points at a non-public address."""
+
+
+class ImageFetchError(Exception):
+    """The remote server answered with a non-success status."""
+
+    def __init__(self, status, url):
+        super().__init__(f"HTTP {status} fetching {url}")
+        self.status = status
+
+    @property
+    def retryable(self):
+        return self.status >= 500
+
+
+def _is_public(address):
+    ip = ipaddress.ip_address(address.split('%', 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not (
+        ip.is_private or ip.is_loopback or ip.is_link_local
+        or ip.is_reserved or ip.is_multicast or ip.is_unspecified
+    )
+
+
+def _resolve_public(host, port):
+    """Resolve `host` and return an address to connect to, refusing non-public ones."""
+    try:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as exc:
+        raise UnsafeImageURL(f"Cannot resolve {host}: {exc}")
+    addresses = [info[4][0] for info in infos]
+    # Every record must be public, or a rebinding-friendly name could mix in an internal one.
+    if not addresses or not all(_is_public(address) for address in addresses):
+        raise UnsafeImageURL(f"{host} does not resolve to a public address.")
+    return addresses[0]
+
+
+class _PinnedHTTPConnection(http.client.HTTPConnection):
+    """Connects to an already validated address instead of resolving the host again."""
+
+    def __init__(self, host, address, **kwargs):
+        super().__init__(host, **kwargs)
+        self._address = address
+
+    def connect(self):
+        self.sock = socket.create_connection((self._address, self.port), self.timeout)
+
+
+class _PinnedHTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, host, address, **kwargs):
+        super().__init__(host, context=ssl.create_default_context(), **kwargs)
+        self._address = address
+
+    def connect(self):
+        sock = socket.create_connection((self._address, self.port), self.timeout)
+        # Certificate and SNI are still checked against the original host name.
+        self.sock = self._context.wrap_socket(sock, server_hostname=self.host)
+
+
+def fetch_image(url):
+    """
+    Download a remote image, refusing anything larger than MAX_SOURCE_BYTES.
+
+    Only http(s) URLs whose host resolves to public addresses are fetched,
+    and the connection goes to the address that was checked. Redirects are
+    followed manually, up to MAX_REDIRECTS, re-validating every hop.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise UnsafeImageURL("Only http and https image URLs are allowed.")
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        address = _resolve_public(parts.hostname, port)
+
+        connection_class = _PinnedHTTPSConnection if parts.scheme == 'https' else _PinnedHTTPConnection
+        connection = connection_class(parts.hostname, address, port=port, timeout=FETCH_TIMEOUT)
+        try:
+            path = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+            connection.request('GET', path, headers={'User-Agent': 'BuildLink-Portfolio/1.0'})
+            response = connection.getresponse()
+            if response.status in REDIRECT_STATUSES and response.getheader('Location'):
+                url = urllib.parse.urljoin(url, response.getheader('Location'))
+                continue
+            if response.status != 200:
+                raise ImageFetchError(response.status, url)
+            data = response.read(MAX_SOURCE_BYTES + 1)
+        finally:
+            connection.close()
+
+        if len(data) > MAX_SOURCE_BYTES:
+            raise ValueError("Image exceeds the maximum allowed size.")
+        return data
+    raise UnsafeImageURL("Too many redirects.")
+
+
+def store_original(data, extension, digest=None):
+    """
+    Store an uploaded original under its content hash.
+    Identical uploads map to the same path and are written once.
+    """
+    digest = digest or content_hash(data)
+    path = f"{_base_path(digest)}/original.{extension.lower().lstrip('.')}"
+    if not default_storage.exists(path):
+        path = default_storage.save(path, ContentFile(data))
+    return digest, path
+
+
+def generate_derivatives(data, digest=None):
+    """
+    Render every DERIVATIVE_WIDTHS x DERIVATIVE_FORMATS variant of the image.
+    Variants already present for this content hash are not re-rendered.
+    Returns {name: {format: storage_path}}.
+    """
+    digest = digest or content_hash(data)
+    base = _base_path(digest)
+    paths = {
+        name: {fmt: f"{base}/{name}.{fmt}" for fmt in DERIVATIVE_FORMATS}
+        for name in DERIVATIVE_WIDTHS
+    }
+    if all(default_storage.exists(path) for variants in paths.values() for path in variants.values()):
+        return paths
+
+    with Image.open(io.BytesIO(data)) as source:
+        source = ImageOps.exif_transpose(source).convert('RGB')
+        for name, width in DERIVATIVE_WIDTHS.items():
+            resized = source.copy()
+            resized.thumbnail((width, width * 4), Image.Resampling.LANCZOS)
+            for fmt, (pil_format, save_options) in DERIVATIVE_FORMATS.items():
+                path = paths[name][fmt]
+                if default_storage.exists(path):
+                    continue
+                buffer = io.BytesIO()
+                resized.save(buffer, pil_format, **save_options)
+                paths[name][fmt] = default_storage.save(path, ContentFile(buffer.getvalue()))
+    return paths
@@ -0,0 +1,68 @@
+import time
+
+from django.contrib.auth import authenticate
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Users.models import User
+from Users.views import CustomLoginSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the login pipeline and report logins/sec for a single "
+        "(sync) gunicorn worker, before and after the single-hash change."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        email = 'bench-login@buildlink.local'
+        password = 'bench-login-password'
+
+        try:
+            with transaction.atomic():
+                User.objects.create_user(
+                    email=email, full_name='Bench Login', phone='+000bench',
+                    role=User.Roles.WORKER, password=password,
+                )
+                legacy = self._run(iterations, lambda: self._legacy_login(email, password))
+                current = self._run(iterations, lambda: self._login(email, password))
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write(f"iterations: {iterations}")
+        self.stdout.write(f"before (double hash): {legacy:.1f} logins/sec per worker")
+        self.stdout.write(f"after  (single hash): {current:.1f} logins/sec per worker")
+        self.stdout.write(self.style.SUCCESS(f"speedup: {current / legacy:.2f}x"))
+
+    def _run(self, iterations, login):
+        login()  # warm up connections and caches
+        started = time.perf_counter()
+        for _ in range(iterations):
+            login()
+        return iterations / (time.perf_counter() - started)
+
+    def _legacy_login(self, email, password):
+        # Mirrors the previous CustomLoginSerializer: lookup + check_password,
+        # then TokenObtainPairSerializer authenticating a second time.
+        user = User.objects.get(email=email, role=User.Roles.WORKER)
+        assert user.check_password(password)
+        user = authenticate(email=email, password=password)
+        refresh = RefreshToken.for_user(user)
+        return str(refresh), str(refresh.access_token)
+
+    def _login(self, email, password):
+        serializer = CustomLoginSerializer(
+            data={'email': email, 'role': User.Roles.WORKER, 'password': password}
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
@@ -0,0 +1,172 @@
+import csv
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from Users.models import NationalID
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a NationalID registry dump (CSV or NDJSON, optionally gzipped) "
+        "into the NationalID table with batched upserts on id_number. "
+        "Progress is checkpointed per chunk, so an interrupted import resumes "
+        "where it stopped and unchanged chunks are never written twice."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['csv', 'ndjson'],
+                            help="Defaults to the file extension.")
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--state-file',
+                            help="Checkpoint file (default: <path>.import-state.json).")
+        parser.add_argument('--full', action='store_true',
+                            help="Ignore stored checksums and upsert every chunk.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f"File not found: {path}")
+
+        fmt = options['format'] or self._detect_format(path)
+        chunk_size = options['chunk_size']
+        state_file = options['state_file'] or f"{path}.import-state.json"
+        state = self._load_state(state_file, chunk_size)
+        if options['full']:
+            state['checksums'] = {}
+
+        started = time.perf_counter()
+        rows_read = rows_written = chunks_skipped = invalid = 0
+
+        for index, (rows, bad) in enumerate(self._chunks(path, fmt, chunk_size)):
+            rows_read += len(rows) + bad
+            invalid += bad
+            checksum = self._checksum(rows)
+
+            if state['checksums'].get(str(index)) == checksum:
+                chunks_skipped += 1
+                continue
+
+            self._upsert(rows)
+            rows_written += len(rows)
+            state['checksums'][str(index)] = checksum
+            self._save_state(state_file, state)
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"chunk {index}: {rows_read} rows read, {rows_written} upserted, "
+                f"{rows_read / elapsed:.0f} rows/s"
+            )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Done in {elapsed:.1f}s: {rows_read} rows read, {rows_written} upserted, "
+            f"{chunks_skipped} unchanged chunks skipped, {invalid} invalid rows."
+        ))
+
+    def _detect_format(self, path):
+        name = path[:-3] if path.endswith('.gz') else path
+        if name.endswith('.csv'):
+            return 'csv'
+        if name.endswith(('.ndjson', '.jsonl')):
+            return 'ndjson'
+        raise CommandError("Cannot detect format from extension; pass --format.")
+
+    def _open(self, path):
+        if path.endswith('.gz'):
+            return gzip.open(path, 'rt', encoding='utf-8', newline='')
+        return open(path, 'r', encoding='utf-8', newline='')
+
+    def _records(self, path, fmt):
+        with self._open(path) as handle:
+            if fmt == 'csv':
+                yield from csv.DictReader(handle)
+            else:
+                for line in handle:
+                    line = line.strip()
+                    if line:
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            yield None
+
+    def _chunks(self, path, fmt, chunk_size):
+        """Yield (rows, invalid_count) per chunk of chunk_size input records."""
+        rows, bad, seen = [], 0, 0
+        for record in self._records(path, fmt):
+            row = self._clean(record)
+            if row is None:
+                bad += 1
+            else:
+                rows.append(row)
+            seen += 1
+            if seen == chunk_size:
+                yield rows, bad
+                rows, bad, seen = [], 0, 0
+        if seen:
+            yield rows, bad
+
+    def _clean(self, record):
+        if not isinstance(record, dict):
+            return None
+        try:
+            id_number = str(record['id_number']).strip()
+            full_name = str(record['full_name']).strip()
+            gender = str(record['gender']).strip()
+            dob = datetime.date.fromisoformat(str(record['dob']).strip())
+        except (KeyError, ValueError):
+            return None
+        if not id_number or not full_name:
+            return None
+        if len(id_number) > 16 or len(full_name) > 100 or len(gender) > 10:
+            return None
+        return (id_number, full_name, dob.isoformat(), gender)
+
+    def _checksum(self, rows):
+        digest = hashlib.sha256()
+        for row in rows:
+            digest.update('\x1f'.join(row).encode())
+            digest.update(b'\x1e')
+        return digest.hexdigest()
+
+    def _upsert(self, rows):
+        # Last occurrence wins if an id_number repeats inside one chunk.
+        by_id = {row[0]: row for row in rows}
+        objs = [
+            NationalID(
+                id_number=id_number, full_name=full_name,
+                dob=datetime.date.fromisoformat(dob), gender=gender,
+            )
+            for id_number, full_name, dob, gender in by_id.values()
+        ]
+        with transaction.atomic():
+            NationalID.objects.bulk_create(
+                objs,
+                update_conflicts=True,
+                unique_fields=['id_number'],
+                update_fields=['full_name', 'dob', 'gender'],
+            )
+
+    def _load_state(self, state_file, chunk_size):
+        try:
+            with open(state_file) as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            state = {}
+        if state.get('chunk_size') != chunk_size:
+            # Chunk boundaries moved, so stored checksums no longer apply.
+            state = {'chunk_size': chunk_size, 'checksums': {}}
+        return state
+
+    def _save_state(self, state_file, state):
+        tmp = f"{state_file}.tmp"
+        with open(tmp, 'w') as handle:
+            json.dump(state, handle)
+        os.replace(tmp, state_file)
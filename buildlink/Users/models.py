@@ -69,6 +69,18 @@ class User(AbstractUser):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['email', 'role'], name='user_email_role_idx'),
+            models.Index(fields=['role', 'verification_status'], name='user_role_verif_idx'),
+            # Admin verification queue: only pending accounts, in keyset order.
+            models.Index(
+                fields=['role', 'created_at', 'id'],
+                name='user_pending_verif_idx',
+                condition=models.Q(verification_status='pending'),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.full_name} ({self.role})"
 
@@ -95,6 +107,16 @@ class Portfolio(models.Model):
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Filled in by the image pipeline (Users.images): SHA-256 of the original
+    # and storage paths of the original and its resized derivatives.
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    derivatives = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'status', '-created_at'], name='portfolio_user_status_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.full_name} - {self.status}"
 
@@ -111,3 +133,46 @@ class NationalID(models.Model):
 
     def __str__(self):
         return f"{self.full_name} - {self.id_number}"
+
+
+class NationalIDVerificationBatch(models.Model):
+    """
+    A batch of (user, id_number) pairs submitted by an admin for
+    verification against the NationalID registry. Processed in the background.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', _('Pending')
+        RUNNING = 'running', _('Running')
+        COMPLETED = 'completed', _('Completed')
+        FAILED = 'failed', _('Failed')
+
+    submitted_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='+')
+    items = models.JSONField()
+    results = models.JSONField(default=list, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    total = models.PositiveIntegerField(default=0)
+    verified_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Batch {self.pk} - {self.status} ({self.verified_count}/{self.total})"
+
+
+class VerificationAuditLog(models.Model):
+    """
+    One row per admin approve/reject decision on a user account.
+    """
+
+    class Action(models.TextChoices):
+        APPROVE = 'approve', _('Approve')
+        REJECT = 'reject', _('Reject')
+
+    admin = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='+')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='verification_audit')
+    action = models.CharField(max_length=10, choices=Action.choices)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.action} {self.user_id} by {self.admin_id}"
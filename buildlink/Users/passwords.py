@@ -0,0 +1,41 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import check_password, make_password
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# A single background thread is enough: upgrades only happen once per user
+# after the hasher settings change, and we never want them to compete with
+# request threads for CPU.
+_upgrade_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='password-upgrade')
+
+
+def _upgrade_password_hash(user_id, old_hash, raw_password):
+    from Users.models import User
+
+    try:
+        new_hash = make_password(raw_password)
+        # Only replace the hash we verified against, so a password change that
+        # lands in the meantime is never overwritten.
+        User.objects.filter(pk=user_id, password=old_hash).update(password=new_hash)
+    except Exception:
+        logger.exception("Password hash upgrade failed for user %s", user_id)
+    finally:
+        close_old_connections()
+
+
+def verify_password(user, raw_password):
+    """
+    Check raw_password against the user's stored hash exactly once.
+
+    If the hash was produced with outdated hasher settings, re-hashing is
+    pushed to a background thread instead of happening inside the request.
+    """
+    old_hash = user.password
+
+    def setter(raw):
+        _upgrade_executor.submit(_upgrade_password_hash, user.pk, old_hash, raw)
+
+    return check_password(raw_password, old_hash, setter)
@@ -0,0 +1,146 @@
+import datetime
+import hashlib
+import math
+import threading
+import time
+
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Answers "definitely absent" or "possibly present" in O(k) with no I/O.
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class RevokedTokenFilter:
+    """
+    Per-process view of the simplejwt blacklist.
+
+    Every blacklisted jti is added to a Bloom filter, which is warmed on first
+    use and then synced incrementally by BlacklistedToken.id. A miss is
+    authoritative and costs no query. A possible hit is confirmed against the
+    database once, and confirmed jtis are kept in an exact set.
+
+    The filter is sized from the blacklist when warmed, with `headroom` for
+    growth, and rebuilt at a new size once syncing has added more jtis than
+    it was sized for, so the false-positive rate stays near `error_rate`.
+
+    Ids are allocated before commit, so a lower id can become visible after a
+    higher one. The sync cursor only moves past rows older than
+    `settle_delay`; younger rows are read again on every sync until they
+    settle, so a late-committing revocation is never skipped.
+    """
+
+    sync_interval = 2.0
+    sync_batch_size = 10_000
+    settle_delay = datetime.timedelta(seconds=30)
+
+    def __init__(self, min_capacity=100_000, headroom=2.0, error_rate=0.001):
+        self.min_capacity = min_capacity
+        self.headroom = headroom
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._reset(min_capacity)
+
+    def _reset(self, capacity):
+        self._bloom = BloomFilter(capacity, self.error_rate)
+        self._count = 0
+        self._confirmed = set()
+        # Every row up to _last_id is settled and in the filter; _unsettled
+        # holds the ids above it that are in the filter but may have gaps below.
+        self._last_id = 0
+        self._unsettled = set()
+        self._last_sync = 0.0
+        self._warm = False
+
+    def _rebuild(self):
+        capacity = max(self.min_capacity, int(BlacklistedToken.objects.count() * self.headroom))
+        self._reset(capacity)
+        self._sync()
+        self._warm = True
+
+    def warm(self):
+        with self._lock:
+            self._rebuild()
+
+    def sync(self, force=False):
+        if not self._warm:
+            self.warm()
+            return
+        if not force and time.monotonic() - self._last_sync < self.sync_interval:
+            return
+        with self._lock:
+            self._sync()
+            if self._count > self._bloom.capacity:
+                self._rebuild()
+
+    def _sync(self):
+        cutoff = timezone.now() - self.settle_delay
+        scan_id = self._last_id
+        settled = True
+        while True:
+            rows = list(
+                BlacklistedToken.objects.filter(id__gt=scan_id)
+                .order_by('id')
+                .values_list('id', 'token__jti', 'blacklisted_at')[:self.sync_batch_size]
+            )
+            for row_id, jti, blacklisted_at in rows:
+                if row_id not in self._unsettled:
+                    self._bloom.add(jti)
+                    self._count += 1
+                # Stop advancing at the first unsettled row; the cursor must never pass a gap.
+                settled = settled and blacklisted_at <= cutoff
+                if settled:
+                    self._last_id = row_id
+                    self._unsettled.discard(row_id)
+                else:
+                    self._unsettled.add(row_id)
+            if rows:
+                scan_id = rows[-1][0]
+            if len(rows) < self.sync_batch_size:
+                break
+        self._last_sync = time.monotonic()
+
+    def add(self, jti):
+        """Record a revocation made by this process without waiting for a sync."""
+        with self._lock:
+            self._bloom.add(jti)
+            self._confirmed.add(jti)
+
+    def is_revoked(self, jti):
+        self.sync()
+        if jti in self._confirmed:
+            return True
+        if jti not in self._bloom:
+            return False
+        if BlacklistedToken.objects.filter(token__jti=jti).exists():
+            with self._lock:
+                self._confirmed.add(jti)
+            return True
+        return False
+
+
+revoked_tokens = RevokedTokenFilter()
@@ -1,15 +1,22 @@
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.validators import URLValidator
+from django.db import transaction
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import smart_bytes, smart_str, DjangoUnicodeDecodeError
-from Users.models import User, NationalID, Portfolio
+from Users.models import User, NationalID, Portfolio, NationalIDVerificationBatch
 
 # If Trades app is separate
 try:
-    from trades.models import Trade, WorkerTrade
+    from trades.models import WorkerTrade
 except Exception:
-    from Users.models import Trade, WorkerTrade
+    from Users.models import WorkerTrade
+from trades.services import sync_worker_trades
+from .tasks import process_portfolio_image
+
 class RegisterSerializer(serializers.ModelSerializer):
     """
     Phase 1 - Minimal registration: role, full_name, email, phone, password, confirm_password.
@@ -114,16 +121,7 @@ class WorkerProfileSerializer(serializers.ModelSerializer):
             if instance.role != User.Roles.WORKER:
                 raise ValidationError({"trades": "Only workers can have trades."})
 
-            # Normalize trade names
-            names = list({t.strip() for t in trades_in if t and t.strip()})
-            new_trades = [Trade.objects.get_or_create(name=name)[0] for name in names]
-
-            # Remove old trades
-            WorkerTrade.objects.filter(user=instance).exclude(trade__in=new_trades).delete()
-
-            # Add new trades
-            for trade in new_trades:
-                WorkerTrade.objects.get_or_create(user=instance, trade=trade)
+            sync_worker_trades(instance, trades_in)
 
         return instance
 
@@ -189,7 +187,8 @@ class ProfileCompletionSerializer(serializers.ModelSerializer):
     """
     national_id_number = serializers.CharField(write_only=True, required=False, allow_null=True, allow_blank=True)
     portfolio_images = serializers.ListField(
-        child=serializers.URLField(), write_only=True, required=False
+        child=serializers.URLField(validators=[URLValidator(schemes=['http', 'https'])]),
+        write_only=True, required=False,
     )
     id_verification_status = serializers.CharField(write_only=True, required=False)
 
@@ -231,15 +230,112 @@ class ProfileCompletionSerializer(serializers.ModelSerializer):
         if id_verification_status is not None:
             instance.verification_status = id_verification_status
 
-        instance.save()
-
-        # Portfolio additions
-        for image_url in portfolio_images:
-            if image_url:
-                Portfolio.objects.create(user=instance, image_url=image_url)
+        with transaction.atomic():
+            instance.save()
+            self._add_portfolio_images(instance, portfolio_images)
 
         return instance
 
+    def _add_portfolio_images(self, instance, portfolio_images):
+        """
+        Insert new portfolio URLs with one bulk_create, skipping URLs the user
+        already has and enforcing PORTFOLIO_MAX_ITEMS under a lock on the user row.
+        """
+        urls = list(dict.fromkeys(url for url in portfolio_images if url))
+        if not urls:
+            return
+
+        # Serializes concurrent additions for the same user.
+        User.objects.select_for_update().filter(pk=instance.pk).exists()
+
+        existing = set(
+            Portfolio.objects.filter(user=instance, image_url__in=urls).values_list('image_url', flat=True)
+        )
+        urls = [url for url in urls if url not in existing]
+        if not urls:
+            return
+
+        current = Portfolio.objects.filter(user=instance).count()
+        if current + len(urls) > settings.PORTFOLIO_MAX_ITEMS:
+            raise serializers.ValidationError({
+                "portfolio_images": f"A portfolio can hold at most {settings.PORTFOLIO_MAX_ITEMS} images."
+            })
+
+        created = Portfolio.objects.bulk_create([Portfolio(user=instance, image_url=url) for url in urls])
+        ids = [portfolio.pk for portfolio in created]
+        transaction.on_commit(lambda: [process_portfolio_image.delay(pk) for pk in ids])
+
+
+# ----------------------------
+# Portfolio
+# ----------------------------
+class PortfolioSerializer(serializers.ModelSerializer):
+    """
+    Portfolio entry with URLs of its resized derivatives, e.g.
+    {"thumb": {"webp": "...", "jpeg": "..."}, "medium": {...}}.
+    Empty until the image pipeline has processed the entry.
+    """
+    thumbnails = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Portfolio
+        fields = ['id', 'image_url', 'status', 'thumbnails', 'created_at']
+        read_only_fields = fields
+
+    def _url(self, path):
+        url = default_storage.url(path)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+    def get_thumbnails(self, obj):
+        return {
+            name: {fmt: self._url(path) for fmt, path in variants.items()}
+            for name, variants in obj.derivatives.items()
+            if name != 'original'
+        }
+
+
+class PortfolioUploadSerializer(serializers.Serializer):
+    image = serializers.ImageField()
+
+
+# ----------------------------
+# Admin Verification Queue
+# ----------------------------
+class VerificationQueueSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = [
+            'id', 'full_name', 'email', 'phone', 'role', 'location',
+            'company_name', 'company_license', 'registration_number',
+            'verification_status', 'created_at'
+        ]
+        read_only_fields = fields
+
+
+class BulkVerificationSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=10000)
+    action = serializers.ChoiceField(choices=['approve', 'reject'])
+
+
+# ----------------------------
+# Batch National ID Verification
+# ----------------------------
+class NationalIDVerificationItemSerializer(serializers.Serializer):
+    user_id = serializers.IntegerField()
+    id_number = serializers.CharField(max_length=16)
+
+
+class NationalIDVerificationBatchCreateSerializer(serializers.Serializer):
+    items = NationalIDVerificationItemSerializer(many=True, allow_empty=False, max_length=10000)
+
+
+class NationalIDVerificationBatchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = NationalIDVerificationBatch
+        fields = ['id', 'status', 'total', 'verified_count', 'created_at', 'finished_at']
+        read_only_fields = fields
+
 
 # ----------------------------
 # Password Reset
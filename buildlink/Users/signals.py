@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from Users.authentication import AUTH_USER_FIELDS, invalidate_cached_users
+from Users.models import User
+
+
+@receiver(post_save, sender=User)
+def invalidate_auth_user_on_save(sender, instance, update_fields=None, **kwargs):
+    # Saves that only touch e.g. last_login or password cannot change the snapshot.
+    if update_fields is not None and not set(update_fields) & set(AUTH_USER_FIELDS):
+        return
+    invalidate_cached_users([instance.pk])
+
+
+@receiver(post_delete, sender=User)
+def invalidate_auth_user_on_delete(sender, instance, **kwargs):
+    invalidate_cached_users([instance.pk])
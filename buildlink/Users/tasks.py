@@ -0,0 +1,90 @@
+import logging
+
+from celery import shared_task
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from Users.images import (
+    RETRYABLE_FETCH_ERRORS,
+    ImageFetchError,
+    content_hash,
+    fetch_image,
+    generate_derivatives,
+)
+from Users.models import NationalIDVerificationBatch, Portfolio
+from Users.verification import verify_national_ids
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def run_national_id_verification_batch(batch_id):
+    batch = NationalIDVerificationBatch.objects.get(pk=batch_id)
+    batch.status = NationalIDVerificationBatch.Status.RUNNING
+    batch.save(update_fields=['status'])
+
+    try:
+        results = verify_national_ids(batch.items)
+    except Exception:
+        batch.status = NationalIDVerificationBatch.Status.FAILED
+        batch.finished_at = timezone.now()
+        batch.save(update_fields=['status', 'finished_at'])
+        raise
+
+    batch.results = results
+    batch.verified_count = sum(1 for row in results if row['result'] == 'verified')
+    batch.status = NationalIDVerificationBatch.Status.COMPLETED
+    batch.finished_at = timezone.now()
+    batch.save(update_fields=['results', 'verified_count', 'status', 'finished_at'])
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def process_portfolio_image(self, portfolio_id):
+    """
+    Hash the portfolio original and render its resized WebP/JPEG derivatives.
+    Uploaded originals are read from storage; URL-only entries are fetched.
+    """
+    portfolio = Portfolio.objects.filter(pk=portfolio_id).first()
+    if portfolio is None:
+        return
+
+    original = portfolio.derivatives.get('original')
+    try:
+        if original:
+            with default_storage.open(original) as handle:
+                data = handle.read()
+        else:
+            data = fetch_image(portfolio.image_url)
+    except ValueError as exc:
+        # Too large, or an unsafe URL (UnsafeImageURL).
+        logger.warning("Portfolio %s image rejected: %s", portfolio_id, exc)
+        return
+    except ImageFetchError as exc:
+        if exc.retryable:
+            raise self.retry(exc=exc)
+        logger.warning("Portfolio %s image could not be fetched: %s", portfolio_id, exc)
+        return
+    except RETRYABLE_FETCH_ERRORS as exc:
+        raise self.retry(exc=exc)
+
+    digest = portfolio.content_hash or content_hash(data)
+    duplicate = (
+        Portfolio.objects.filter(user_id=portfolio.user_id, content_hash=digest)
+        .exclude(pk=portfolio_id)
+        .exists()
+    )
+    if duplicate:
+        # Same picture already in this user's portfolio under another URL.
+        Portfolio.objects.filter(pk=portfolio_id).delete()
+        return
+
+    try:
+        derivatives = generate_derivatives(data, digest)
+    except OSError:
+        # Pillow raises OSError subclasses for data it cannot decode.
+        logger.warning("Portfolio %s is not a readable image", portfolio_id)
+        return
+
+    if original:
+        derivatives['original'] = original
+    Portfolio.objects.filter(pk=portfolio_id).update(content_hash=digest, derivatives=derivatives)
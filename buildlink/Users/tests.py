@@ -1,3 +1,245 @@
-from django.test import TestCase
+import datetime
+import http.client
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from celery.exceptions import Retry
+from django.db import connection
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from Users.authentication import CachedJWTAuthentication
+from Users.images import ImageFetchError, UnsafeImageURL, fetch_image
+from Users.models import Portfolio, User
+from Users.revocation import RevokedTokenFilter
+from Users.serializers import WorkerProfileSerializer
+from Users.tasks import process_portfolio_image
+from Users.tokens import FilteredRefreshToken
+from trades.models import WorkerTrade
+
+
+class FetchImageTests(TestCase):
+    def test_rejects_non_http_schemes(self):
+        for url in ['file:///etc/passwd', 'ftp://example.com/a.jpg', 'gopher://example.com/']:
+            with self.assertRaises(UnsafeImageURL):
+                fetch_image(url)
+
+    def test_rejects_internal_addresses(self):
+        for url in [
+            'http://127.0.0.1/a.jpg',
+            'http://10.0.0.5/a.jpg',
+            'http://169.254.169.254/latest/meta-data/',
+            'http://[::1]/a.jpg',
+            'http://0.0.0.0/a.jpg',
+        ]:
+            with self.assertRaises(UnsafeImageURL):
+                fetch_image(url)
+
+    def test_rejects_host_with_any_internal_record(self):
+        records = [
+            (None, None, None, '', ('93.184.216.34', 80)),
+            (None, None, None, '', ('192.168.1.10', 80)),
+        ]
+        with mock.patch('Users.images.socket.getaddrinfo', return_value=records):
+            with self.assertRaises(UnsafeImageURL):
+                fetch_image('http://images.example.com/a.jpg')
+
+
+class ProcessPortfolioImageTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            email='worker@example.com', full_name='Worker', phone='+250700000001', role=User.Roles.WORKER,
+        )
+        self.portfolio = Portfolio.objects.create(user=user, image_url='https://images.example.com/a.jpg')
+
+    def run_with(self, error):
+        with mock.patch('Users.tasks.fetch_image', side_effect=error):
+            return process_portfolio_image.apply(args=[self.portfolio.pk], throw=True)
+
+    def test_client_errors_are_not_retried(self):
+        for status in (403, 404):
+            with mock.patch.object(process_portfolio_image, 'retry') as retry:
+                self.run_with(ImageFetchError(status, self.portfolio.image_url))
+            retry.assert_not_called()
+
+    def test_server_and_connection_errors_are_retried(self):
+        for error in (
+            ImageFetchError(503, self.portfolio.image_url),
+            ConnectionResetError(),
+            TimeoutError(),
+            http.client.RemoteDisconnected(),
+        ):
+            with mock.patch.object(process_portfolio_image, 'retry', side_effect=Retry()) as retry:
+                with self.assertRaises(Retry):
+                    self.run_with(error)
+            retry.assert_called_once()
+
+    def test_unsafe_urls_are_dropped(self):
+        with mock.patch.object(process_portfolio_image, 'retry') as retry:
+            self.run_with(UnsafeImageURL("internal"))
+        retry.assert_not_called()
+        self.portfolio.refresh_from_db()
+        self.assertEqual(self.portfolio.content_hash, '')
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def test_local_memory_cache_is_not_used_for_auth_users(self):
+        user = User.objects.create_user(
+            email='owner@example.com', full_name='Owner', phone='+250700000002', role=User.Roles.OWNER,
+        )
+        token = AccessToken.for_user(user)
+        auth = CachedJWTAuthentication()
+        authenticated = auth.get_user(token)
+        self.assertEqual((authenticated.pk, authenticated.role, authenticated.is_active), (user.pk, 'owner', True))
+
+        # A queryset update sends no signal, so only an uncached read sees it.
+        User.objects.filter(pk=user.pk).update(is_active=False)
+        with self.assertNumQueries(1), self.assertRaises(AuthenticationFailed):
+            auth.get_user(token)
+
+    def test_profile_views_load_the_user_row_once(self):
+        user = User.objects.create_user(
+            email='owner@example.com', full_name='Owner', phone='+250700000002', role=User.Roles.OWNER,
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        table = User._meta.db_table
+        for name in ('user_profile', 'owner_profile'):
+            with self.subTest(name), CaptureQueriesContext(connection) as queries:
+                response = client.get(reverse(name))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['email'], 'owner@example.com')
+            self.assertEqual(sum(f'FROM "{table}"' in query['sql'] for query in queries), 1)
+
+
+class WorkerProfileTradesTests(TestCase):
+    def update_trades(self, user, trades):
+        serializer = WorkerProfileSerializer(instance=user, data={'trades': trades}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        return len(queries)
+
+    def test_trade_update_queries_do_not_grow_with_trades(self):
+        user = User.objects.create_user(
+            email='tiler@example.com', full_name='Tiler', phone='+250700000003', role=User.Roles.WORKER,
+        )
+        self.update_trades(user, ['plumber', 'painter', 'mason', 'roofer'])
+
+        one = self.update_trades(user, ['plumber'])
+        four = self.update_trades(user, ['plumber', 'painter', 'mason', 'roofer'])
+        self.assertEqual(one, four)
+        self.assertEqual(
+            sorted(WorkerTrade.objects.filter(user=user).values_list('trade__name', flat=True)),
+            ['mason', 'painter', 'plumber', 'roofer'],
+        )
+
+
+class PortfolioUploadTests(TestCase):
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        self.enterContext(override_settings(MEDIA_ROOT=self.media, PORTFOLIO_MAX_ITEMS=2))
+        self.user = User.objects.create_user(
+            email='mason@example.com', full_name='Mason', phone='+250700000004', role=User.Roles.WORKER,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def upload(self, color):
+        buffer = io.BytesIO()
+        Image.new('RGB', (8, 8), color).save(buffer, 'PNG')
+        image = SimpleUploadedFile('work.png', buffer.getvalue(), content_type='image/png')
+        return self.client.post(reverse('portfolio-upload'), {'image': image}, format='multipart')
+
+    def stored_files(self):
+        return [name for _, _, names in os.walk(self.media) for name in names]
+
+    def test_duplicate_upload_returns_existing_entry(self):
+        first = self.upload('red')
+        self.assertEqual(first.status_code, 201)
+        second = self.upload('red')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data['id'], first.data['id'])
+        self.assertEqual(len(self.stored_files()), 1)
+
+    def test_nothing_is_stored_when_portfolio_is_full(self):
+        Portfolio.objects.bulk_create([
+            Portfolio(user=self.user, image_url=f'https://images.example.com/{i}.jpg') for i in range(2)
+        ])
+        response = self.upload('blue')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Portfolio.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(self.stored_files(), [])
+
+
+class RevokedTokenFilterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='roofer@example.com', full_name='Roofer', phone='+250700000005', role=User.Roles.WORKER,
+        )
+
+    def revoke(self, count):
+        jtis = []
+        for _ in range(count):
+            token = FilteredRefreshToken.for_user(self.user)
+            token.blacklist()
+            jtis.append(token['jti'])
+        return jtis
+
+    def test_sized_from_blacklist_on_warm(self):
+        revoked = self.revoke(5)
+        tokens = RevokedTokenFilter(min_capacity=4, headroom=2.0)
+        tokens.warm()
+        self.assertEqual(tokens._bloom.capacity, 10)
+        self.assertTrue(all(tokens.is_revoked(jti) for jti in revoked))
+
+    def test_rebuilt_when_synced_count_exceeds_capacity(self):
+        revoked = self.revoke(2)
+        tokens = RevokedTokenFilter(min_capacity=4, headroom=2.0)
+        tokens.warm()
+        self.assertEqual(tokens._bloom.capacity, 4)
+
+        revoked += self.revoke(3)
+        tokens.sync(force=True)
+        self.assertEqual(tokens._bloom.capacity, 10)
+        self.assertEqual(tokens._count, 5)
+        self.assertTrue(all(tokens.is_revoked(jti) for jti in revoked))
+        self.assertFalse(tokens.is_revoked(FilteredRefreshToken.for_user(self.user)['jti']))
+
+    def blacklist_row(self, row_id, jti, age):
+        token = OutstandingToken.objects.create(
+            user=self.user, jti=jti, token='-', expires_at=timezone.now() + datetime.timedelta(days=1),
+        )
+        BlacklistedToken.objects.create(id=row_id, token=token)
+        BlacklistedToken.objects.filter(id=row_id).update(blacklisted_at=timezone.now() - age)
+
+    def test_late_commit_with_lower_id_is_not_skipped(self):
+        old, recent = datetime.timedelta(minutes=5), datetime.timedelta(seconds=1)
+        self.blacklist_row(10, 'settled', old)
+        self.blacklist_row(30, 'committed-first', recent)
+        tokens = RevokedTokenFilter(min_capacity=4)
+        tokens.warm()
+        self.assertEqual(tokens._last_id, 10)
+
+        # Id 20 was allocated before 30 but its transaction commits later.
+        self.blacklist_row(20, 'committed-late', recent)
+        tokens.sync(force=True)
+        self.assertTrue(tokens.is_revoked('committed-late'))
+        self.assertEqual(tokens._count, 3)
+
+        # Once everything is older than the settle delay the cursor catches up.
+        BlacklistedToken.objects.update(blacklisted_at=timezone.now() - old)
+        tokens.sync(force=True)
+        self.assertEqual((tokens._last_id, tokens._unsettled, tokens._count), (30, set(), 3))
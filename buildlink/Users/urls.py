@@ -6,7 +6,10 @@ from rest_framework_simplejwt.views import (
 from .views import (
     RegisterView, UserProfileView, LogoutView, WorkerProfileView,
     LoginView, CustomTokenRefreshView,
-    StudentProfileView, OwnerProfileView, CompanyProfileView
+    StudentProfileView, OwnerProfileView, CompanyProfileView,
+    NationalIDBatchVerificationView, NationalIDBatchDetailView, NationalIDBatchReportView,
+    PortfolioUploadView, PortfolioListView,
+    VerificationQueueView, BulkVerificationView
 )
 
 urlpatterns = [
@@ -20,8 +23,20 @@ urlpatterns = [
     path('student/profile/', StudentProfileView.as_view(), name='student_profile'),
     path('owner/profile/', OwnerProfileView.as_view(), name='owner_profile'),
     path('company/profile/', CompanyProfileView.as_view(), name='company_profile'),
+    path('portfolio/', PortfolioListView.as_view(), name='portfolio-list'),
+    path('portfolio/upload/', PortfolioUploadView.as_view(), name='portfolio-upload'),
+    path('users/<int:user_id>/portfolio/', PortfolioListView.as_view(), name='user-portfolio-list'),
     path('password-reset/', PasswordResetRequestView.as_view(), name='password-reset'),
     path('password-reset/<uidb64>/<token>/', PasswordResetConfirmView.as_view(), name='password-reset-confirm'),
+
+    # Verification queue (admin)
+    path('admin/verification-queue/', VerificationQueueView.as_view(), name='verification-queue'),
+    path('admin/verification-queue/bulk/', BulkVerificationView.as_view(), name='verification-queue-bulk'),
+
+    # Batch National ID verification (admin)
+    path('admin/national-ids/verify/', NationalIDBatchVerificationView.as_view(), name='national-id-batch-verify'),
+    path('admin/national-ids/verify/<int:pk>/', NationalIDBatchDetailView.as_view(), name='national-id-batch-detail'),
+    path('admin/national-ids/verify/<int:pk>/report/', NationalIDBatchReportView.as_view(), name='national-id-batch-report'),
     
     # New endpoint for worker profile
 ]
@@ -0,0 +1,77 @@
+from Users.authentication import invalidate_cached_users
+from Users.models import NationalID, User
+
+LOOKUP_CHUNK_SIZE = 1000
+
+GENDER_ALIASES = {'m': 'male', 'f': 'female'}
+
+
+def _normalize_name(value):
+    return ' '.join((value or '').split()).casefold()
+
+
+def _normalize_gender(value):
+    value = (value or '').strip().casefold()
+    return GENDER_ALIASES.get(value, value)
+
+
+def _chunked(values, size=LOOKUP_CHUNK_SIZE):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def verify_national_ids(items):
+    """
+    Verify many {"user_id", "id_number"} pairs against the registry.
+
+    Users, registry rows and existing links are resolved with a handful of
+    id__in / id_number__in queries, and matching users are updated with a
+    single bulk_update. Returns one result dict per item, in input order.
+    """
+    user_ids = {item['user_id'] for item in items}
+    id_numbers = {item['id_number'] for item in items}
+
+    users = {}
+    for chunk in _chunked(user_ids):
+        users.update(User.objects.only('id', 'full_name', 'gender', 'national_id', 'verified').in_bulk(chunk))
+
+    registry = {}
+    for chunk in _chunked(id_numbers):
+        registry.update(NationalID.objects.in_bulk(chunk, field_name='id_number'))
+
+    # Registry entries already linked to a user (national_id is one-to-one).
+    linked_to = {}
+    for chunk in _chunked(nid.pk for nid in registry.values()):
+        linked_to.update(
+            User.objects.filter(national_id_id__in=chunk).values_list('national_id_id', 'id')
+        )
+
+    results, to_update, claimed = [], [], {}
+    for item in items:
+        user = users.get(item['user_id'])
+        nid = registry.get(item['id_number'])
+        outcome = 'verified'
+
+        if user is None:
+            outcome = 'user_not_found'
+        elif nid is None:
+            outcome = 'id_not_found'
+        elif linked_to.get(nid.pk, user.pk) != user.pk or claimed.get(nid.pk, user.pk) != user.pk:
+            outcome = 'id_in_use'
+        elif _normalize_name(user.full_name) != _normalize_name(nid.full_name):
+            outcome = 'name_mismatch'
+        elif user.gender and _normalize_gender(user.gender) != _normalize_gender(nid.gender):
+            outcome = 'gender_mismatch'
+
+        if outcome == 'verified':
+            claimed[nid.pk] = user.pk
+            user.national_id = nid
+            user.verified = True
+            to_update.append(user)
+
+        results.append({'user_id': item['user_id'], 'id_number': item['id_number'], 'result': outcome})
+
+    User.objects.bulk_update(to_update, ['national_id', 'verified'], batch_size=500)
+    invalidate_cached_users([user.pk for user in to_update])
+    return results
@@ -1,26 +1,44 @@
+import csv
+
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+from rest_framework_simplejwt.tokens import TokenError
 
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import smart_bytes
-from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse
+from django.core.files.storage import default_storage
+from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 
-from Users.models import User
+from Users.models import User, NationalIDVerificationBatch, Portfolio, VerificationAuditLog
 from .serializers import (
     RegisterSerializer,
     UserSerializer,
     WorkerProfileSerializer,
     PasswordResetRequestSerializer,
     PasswordResetConfirmSerializer,
-    ProfileCompletionSerializer
+    ProfileCompletionSerializer,
+    NationalIDVerificationBatchCreateSerializer,
+    NationalIDVerificationBatchSerializer,
+    PortfolioSerializer,
+    PortfolioUploadSerializer,
+    VerificationQueueSerializer,
+    BulkVerificationSerializer,
 )
 from .serializers import StudentProfileSerializer, OwnerProfileSerializer, CompanyProfileSerializer
 from .permissions import IsStudent, IsOwner, IsCompany
+from .tokens import FilteredRefreshToken
+from .tasks import run_national_id_verification_batch, process_portfolio_image
+from .images import content_hash, store_original
+from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from .authentication import invalidate_cached_users
+from notifications.outbox import enqueue_email
 
 
 # ----------------------------
@@ -52,12 +70,18 @@ class RegisterView(generics.CreateAPIView):
 # ----------------------------
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework import serializers
+from django.contrib.auth.models import update_last_login
+from .passwords import verify_password
 
 
 class CustomLoginSerializer(TokenObtainPairSerializer):
     """
     Custom login serializer to authenticate using role, email, and password.
+
+    The password is verified exactly once and the token pair is issued from
+    the user we already loaded, instead of going through authenticate() again.
     """
     def validate(self, attrs):
         email = self.initial_data.get("email")
@@ -67,23 +91,23 @@ class CustomLoginSerializer(TokenObtainPairSerializer):
         if not email or not role or not password:
             raise serializers.ValidationError("Email, role, and password are required for login.")
 
-        try:
-            user = User.objects.get(email=email, role=role)
-        except User.DoesNotExist:
+        user = User.objects.filter(email=email, role=role).first()
+        if user is None:
             raise serializers.ValidationError("Invalid credentials or role.")
 
-        if not user.check_password(password):
+        if not user.is_active or not verify_password(user, password):
             raise serializers.ValidationError("Invalid credentials.")
 
-        # Let parent serializer create tokens. It expects username_field in attrs
-        attrs[self.username_field] = email
-        attrs['password'] = password
-        data = super().validate(attrs)
+        self.user = user
+        refresh = self.get_token(user)
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
 
         # Normalize response keys to what frontend expects
         response = {
-            'access_token': data.get('access'),
-            'refresh_token': data.get('refresh'),
+            'access_token': str(refresh.access_token),
+            'refresh_token': str(refresh),
             'role': user.role,
             'full_name': user.full_name,
             'email': user.email,
@@ -130,7 +154,7 @@ class LogoutView(APIView):
             return Response({"detail": "Refresh token is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            token = RefreshToken(refresh_token)
+            token = FilteredRefreshToken(refresh_token)
             token.blacklist()
             return Response({"detail": "Successfully logged out."}, status=status.HTTP_205_RESET_CONTENT)
         except TokenError:
@@ -153,7 +177,7 @@ class CustomTokenRefreshView(APIView):
             return Response({"detail": "refreshToken is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            refresh = RefreshToken(refresh_token)
+            refresh = FilteredRefreshToken(refresh_token)
             access_token = str(refresh.access_token)
             return Response({
                 'access_token': access_token
@@ -170,6 +194,7 @@ class UserProfileView(APIView):
     Fetch current user's profile based on token.
     """
     permission_classes = [permissions.IsAuthenticated]
+    full_auth_user = True
     
     
     @swagger_auto_schema(tags=["Authentication"])
@@ -206,6 +231,7 @@ class WorkerProfileView(generics.RetrieveUpdateAPIView):
     """
     serializer_class = WorkerProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    full_auth_user = True
     
     @swagger_auto_schema(tags=["Authentication"])
     def post(self, request, *args, **kwargs):
@@ -225,6 +251,7 @@ class WorkerProfileView(generics.RetrieveUpdateAPIView):
 class StudentProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = StudentProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsStudent]
+    full_auth_user = True
 
     @swagger_auto_schema(tags=["Authentication"], operation_summary="Student profile")
     def get(self, request, *args, **kwargs):
@@ -240,6 +267,7 @@ class StudentProfileView(generics.RetrieveUpdateAPIView):
 class OwnerProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = OwnerProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    full_auth_user = True
 
     @swagger_auto_schema(tags=["Authentication"], operation_summary="Owner profile")
     def get(self, request, *args, **kwargs):
@@ -255,6 +283,7 @@ class OwnerProfileView(generics.RetrieveUpdateAPIView):
 class CompanyProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = CompanyProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsCompany]
+    full_auth_user = True
 
     @swagger_auto_schema(tags=["Authentication"], operation_summary="Company profile")
     def get(self, request, *args, **kwargs):
@@ -296,9 +325,229 @@ class CompanyVerificationView(APIView):
             return Response({"detail": "Invalid action."}, status=status.HTTP_400_BAD_REQUEST)
 
         company.save()
+        VerificationAuditLog.objects.create(admin=request.user, user=company, action=action)
         return Response({"detail": f"Company {action} successfully."}, status=status.HTTP_200_OK)
 
 
+# ----------------------------
+# Admin Verification Queue
+# ----------------------------
+VERIFIABLE_ROLES = [User.Roles.COMPANY, User.Roles.WORKER]
+
+
+class VerificationQueuePagination(CursorPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('created_at', 'id')
+
+
+class VerificationQueueView(generics.ListAPIView):
+    """
+    Pending companies and workers, oldest first, keyset-paginated.
+    Filter with ?role=company or ?role=worker.
+    """
+    serializer_class = VerificationQueueSerializer
+    permission_classes = [permissions.IsAdminUser]
+    pagination_class = VerificationQueuePagination
+    filter_backends = []
+
+    @swagger_auto_schema(tags=["Verification"])
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        role = self.request.query_params.get('role')
+        roles = [role] if role in VERIFIABLE_ROLES else VERIFIABLE_ROLES
+        return User.objects.filter(verification_status='pending', role__in=roles)
+
+
+class BulkVerificationView(APIView):
+    """
+    Approve or reject many pending accounts with a single UPDATE.
+    Ids that are not pending companies/workers are reported as skipped.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(tags=["Verification"], request_body=BulkVerificationSerializer)
+    def post(self, request):
+        serializer = BulkVerificationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        requested = set(serializer.validated_data['ids'])
+        action = serializer.validated_data['action']
+        approve = action == VerificationAuditLog.Action.APPROVE
+
+        with transaction.atomic():
+            ids = list(
+                User.objects.select_for_update()
+                .filter(id__in=requested, verification_status='pending', role__in=VERIFIABLE_ROLES)
+                .values_list('id', flat=True)
+            )
+            User.objects.filter(id__in=ids).update(
+                verified=approve,
+                verification_status='approved' if approve else 'rejected',
+            )
+            VerificationAuditLog.objects.bulk_create(
+                [VerificationAuditLog(admin_id=request.user.pk, user_id=user_id, action=action) for user_id in ids],
+                batch_size=1000,
+            )
+
+        invalidate_cached_users(ids)
+        return Response({
+            "updated": len(ids),
+            "skipped": sorted(requested.difference(ids)),
+        }, status=status.HTTP_200_OK)
+
+
+# ----------------------------
+# Portfolio Listing
+# ----------------------------
+class PortfolioPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class PortfolioListView(generics.ListAPIView):
+    """
+    List a user's portfolio, newest first.
+    Owners see every entry and may filter by ?status=; others see approved entries only.
+    """
+    serializer_class = PortfolioSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = PortfolioPagination
+
+    @swagger_auto_schema(tags=["Portfolio"])
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return Portfolio.objects.none()
+
+        user_id = self.kwargs.get('user_id', self.request.user.pk)
+        queryset = Portfolio.objects.filter(user_id=user_id)
+
+        if user_id == self.request.user.pk:
+            status_filter = self.request.query_params.get('status')
+            if status_filter in Portfolio.Status.values:
+                queryset = queryset.filter(status=status_filter)
+        else:
+            queryset = queryset.filter(status=Portfolio.Status.APPROVED)
+
+        return queryset.order_by('-created_at', '-id')
+
+
+# ----------------------------
+# Portfolio Upload
+# ----------------------------
+class PortfolioUploadView(APIView):
+    """
+    Upload a portfolio image. The original is stored under its content hash
+    and resized thumbnails are generated in the background.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    @swagger_auto_schema(tags=["Portfolio"], request_body=PortfolioUploadSerializer,
+                         responses={201: PortfolioSerializer})
+    def post(self, request):
+        serializer = PortfolioUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        image = serializer.validated_data['image']
+
+        extension = (getattr(getattr(image, 'image', None), 'format', None) or 'jpeg').lower()
+        data = image.read()
+        digest = content_hash(data)
+
+        with transaction.atomic():
+            # Serializes concurrent uploads for the same user, as in
+            # ProfileCompletionSerializer._add_portfolio_images.
+            User.objects.select_for_update().filter(pk=request.user.pk).exists()
+
+            duplicate = Portfolio.objects.filter(user_id=request.user.pk, content_hash=digest).first()
+            if duplicate is not None:
+                return Response(PortfolioSerializer(duplicate, context={'request': request}).data)
+
+            if Portfolio.objects.filter(user_id=request.user.pk).count() >= settings.PORTFOLIO_MAX_ITEMS:
+                return Response(
+                    {"detail": f"A portfolio can hold at most {settings.PORTFOLIO_MAX_ITEMS} images."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Stored only once the upload is accepted. Originals are shared by
+            # content hash, so the file is never deleted on a later failure.
+            _, path = store_original(data, extension, digest)
+            portfolio = Portfolio.objects.create(
+                user_id=request.user.pk,
+                image_url=request.build_absolute_uri(default_storage.url(path)),
+                content_hash=digest,
+                derivatives={'original': path},
+            )
+            transaction.on_commit(lambda: process_portfolio_image.delay(portfolio.pk))
+        return Response(
+            PortfolioSerializer(portfolio, context={'request': request}).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# ----------------------------
+# Batch National ID Verification
+# ----------------------------
+class NationalIDBatchVerificationView(APIView):
+    """
+    Admin submits many (user_id, id_number) pairs for verification.
+    The batch is processed in the background; poll it and download the report.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(tags=["Verification"], request_body=NationalIDVerificationBatchCreateSerializer,
+                         responses={202: NationalIDVerificationBatchSerializer})
+    def post(self, request):
+        serializer = NationalIDVerificationBatchCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data['items']
+
+        batch = NationalIDVerificationBatch.objects.create(
+            submitted_by=request.user, items=items, total=len(items)
+        )
+        transaction.on_commit(lambda: run_national_id_verification_batch.delay(batch.pk))
+        return Response(NationalIDVerificationBatchSerializer(batch).data, status=status.HTTP_202_ACCEPTED)
+
+
+class NationalIDBatchDetailView(generics.RetrieveAPIView):
+    queryset = NationalIDVerificationBatch.objects.defer('items', 'results')
+    serializer_class = NationalIDVerificationBatchSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(tags=["Verification"])
+    def get(self, request, *args, **kwargs):
+        """
+        Batch verification status.
+        """
+        return super().get(request, *args, **kwargs)
+
+
+class NationalIDBatchReportView(APIView):
+    """
+    Download the per-item results of a completed batch as CSV.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(tags=["Verification"])
+    def get(self, request, pk):
+        batch = get_object_or_404(NationalIDVerificationBatch, pk=pk)
+        if batch.status != NationalIDVerificationBatch.Status.COMPLETED:
+            return Response({"detail": f"Batch is {batch.status}."}, status=status.HTTP_409_CONFLICT)
+
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="national-id-batch-{batch.pk}.csv"'
+        writer = csv.DictWriter(response, fieldnames=['user_id', 'id_number', 'result'])
+        writer.writeheader()
+        writer.writerows(batch.results)
+        return response
+
+
 # ----------------------------
 # Password Reset - Step 1: Request Link
 # ----------------------------
@@ -330,13 +579,11 @@ class PasswordResetRequestView(APIView):
         # Build reset link
         reset_link = f"{settings.FRONTEND_URL}/reset-password/{uidb64}/{token}/"
 
-        # Send email
-        send_mail(
+        # Queue email; delivery happens in the background
+        enqueue_email(
             subject="BuildLink - Password Reset",
-            message=f"Hi {user.full_name},\n\nClick the link below to reset your password:\n{reset_link}\n\nIf you didn't request this, ignore this email.",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
+            body=f"Hi {user.full_name},\n\nClick the link below to reset your password:\n{reset_link}\n\nIf you didn't request this, ignore this email.",
+            recipients=[user.email],
         )
 
         return Response({"detail": "Password reset link sent to email."}, status=status.HTTP_200_OK)
@@ -1,5 +1,9 @@
 from django.contrib import admin
-from .models import Application
+from .models import Application, ApplicationEvent, JobDecisionStats, OwnerDecisionStats, EventLogCursor
 admin.site.register(Application)
+admin.site.register(ApplicationEvent)
+admin.site.register(JobDecisionStats)
+admin.site.register(OwnerDecisionStats)
+admin.site.register(EventLogCursor)
 
 # Register your models here.
@@ -0,0 +1,108 @@
+import time
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from projects.models import Job
+
+from .models import Application
+
+STATUS_COUNTERS = {
+    Application.Status.PENDING: 'applications_pending',
+    Application.Status.ACCEPTED: 'applications_accepted',
+    Application.Status.REJECTED: 'applications_rejected',
+}
+
+
+def live_counts():
+    """
+    Annotations that recompute each counter from the applications table,
+    named like the Job fields with a `live_` prefix.
+    """
+    annotations = {'live_applications_total': Count('applications')}
+    for status, field in STATUS_COUNTERS.items():
+        annotations[f'live_{field}'] = Count('applications', filter=Q(applications__status=status))
+    return annotations
+
+
+def counter_deltas(changes):
+    """
+    Turn (job_id, old_status, new_status) changes into {job_id: Counter}
+    of counter field deltas. old_status is None for a new application and
+    new_status is None for a deleted one.
+    """
+    deltas = defaultdict(Counter)
+    for job_id, old_status, new_status in changes:
+        if old_status == new_status:
+            continue
+        delta = deltas[job_id]
+        if old_status is None:
+            delta['applications_total'] += 1
+        else:
+            delta[STATUS_COUNTERS[old_status]] -= 1
+        if new_status is None:
+            delta['applications_total'] -= 1
+        else:
+            delta[STATUS_COUNTERS[new_status]] += 1
+    return deltas
+
+
+def apply_counter_deltas(deltas):
+    """
+    Apply {job_id: Counter} deltas with F() updates. Jobs sharing the same
+    delta are updated by a single statement.
+    """
+    groups = defaultdict(list)
+    for job_id, delta in deltas.items():
+        key = tuple(sorted((field, value) for field, value in delta.items() if value))
+        if key:
+            groups[key].append(job_id)
+    for key, job_ids in groups.items():
+        Job.objects.filter(id__in=job_ids).update(**{field: F(field) + value for field, value in key})
+
+
+def reconcile_counters(chunk_size=2000, dry_run=False, sleep=0.0, report=None):
+    """
+    Recount applications per job in id-ordered chunks and correct drift in
+    the Job counters with F() deltas, so writes made meanwhile are not lost.
+    Jobs created before the counters existed start at 0 and are filled in
+    here. `report(job_id, delta)` is called for every drifted job.
+    Returns (jobs checked, jobs drifted).
+    """
+    fields = Job.COUNTER_FIELDS
+    last_id = 0
+    checked = drifted = 0
+
+    while True:
+        ids = list(
+            Job.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:chunk_size]
+        )
+        if not ids:
+            break
+
+        # Stored and live values come from one statement, so the deltas
+        # are relative to a single snapshot.
+        rows = (
+            Job.objects.filter(id__in=ids).order_by()
+            .annotate(**live_counts())
+            .values('id', *fields, *(f'live_{field}' for field in fields))
+        )
+        deltas = {}
+        for row in rows:
+            delta = Counter({field: row[f'live_{field}'] - row[field] for field in fields})
+            if any(delta.values()):
+                deltas[row['id']] = delta
+                if report:
+                    report(row['id'], delta)
+
+        if deltas and not dry_run:
+            with transaction.atomic():
+                apply_counter_deltas(deltas)
+
+        last_id = ids[-1]
+        checked += len(ids)
+        drifted += len(deltas)
+        if sleep:
+            time.sleep(sleep)
+    return checked, drifted
@@ -0,0 +1,26 @@
+from django.utils import timezone
+
+from .models import ApplicationEvent
+
+EVENT_BATCH_SIZE = 1000
+
+
+def record_events(changes, source, now=None):
+    """
+    Append one ApplicationEvent per (application_id, job_id, from_status,
+    to_status) change with a single bulk INSERT per batch. Call inside the
+    transaction that makes the changes.
+    """
+    now = now or timezone.now()
+    ApplicationEvent.objects.bulk_create(
+        [
+            ApplicationEvent(
+                application_id=application_id, job_id=job_id,
+                from_status=from_status, to_status=to_status,
+                source=source, created_at=now,
+            )
+            for application_id, job_id, from_status, to_status in changes
+            if from_status != to_status
+        ],
+        batch_size=EVENT_BATCH_SIZE,
+    )
@@ -0,0 +1,133 @@
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from Users.models import User
+from applications.models import Application
+from projects.models import Job
+
+SEED_DOMAIN = 'loadtest-apply.buildlink.local'
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire many concurrent applications at a single job and report the "
+        "status code mix and p50/p99 latency. Fails if any request returns "
+        "a 5xx or the job's counters disagree with its applications. Runs "
+        "in-process by default; use --base-url to target a running server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applicants', type=int, default=2000)
+        parser.add_argument('--concurrency', type=int, default=64)
+        parser.add_argument('--duplicates', type=int, default=1,
+                            help="Extra attempts per applicant, sent concurrently with the first.")
+        parser.add_argument('--base-url', help="e.g. http://localhost:8000; default is in-process.")
+        parser.add_argument('--keep', action='store_true', help="Keep the seeded users and job.")
+
+    def handle(self, *args, **options):
+        if options['base_url'] is None and connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING(
+                "SQLite serializes writers; expect lock waits to dominate latency."
+            ))
+
+        owner, job, workers = self._seed(options['applicants'])
+        try:
+            path = reverse('job-apply', kwargs={'job_id': job.pk})
+            tokens = [str(AccessToken.for_user(worker)) for worker in workers]
+            attempts = [token for token in tokens for _ in range(1 + options['duplicates'])]
+
+            send = self._remote(options['base_url'] + path) if options['base_url'] else self._local(path)
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+                results = list(pool.map(send, attempts))
+            elapsed = time.perf_counter() - started
+
+            self._report(results, elapsed)
+            self._check(job, results, len(workers))
+        finally:
+            if not options['keep']:
+                User.objects.filter(email__endswith=SEED_DOMAIN).delete()
+
+    def _seed(self, count):
+        User.objects.filter(email__endswith=SEED_DOMAIN).delete()
+        owner = User.objects.create(
+            email=f'owner@{SEED_DOMAIN}', full_name='Load Test Owner', phone='+000loadown',
+            role=User.Roles.COMPANY, password='!',
+        )
+        User.objects.bulk_create([
+            User(email=f'worker{i}@{SEED_DOMAIN}', full_name=f'Load Worker {i}', phone=f'+3{i:09d}',
+                 role=User.Roles.WORKER, password='!')
+            for i in range(count)
+        ], batch_size=2000)
+        workers = list(User.objects.filter(email__startswith='worker', email__endswith=SEED_DOMAIN))
+        job = Job.objects.create(
+            posted_by=owner, title='Load test job', description='Surge target.',
+            location='Kigali', type=Job.JobType.JOB,
+        )
+        return owner, job, workers
+
+    def _local(self, path):
+        local = threading.local()
+
+        def send(token):
+            if not hasattr(local, 'client'):
+                local.client = Client()
+            started = time.perf_counter()
+            response = local.client.post(path, HTTP_AUTHORIZATION=f'Bearer {token}')
+            return response.status_code, time.perf_counter() - started
+
+        return send
+
+    def _remote(self, url):
+        def send(token):
+            request = urllib.request.Request(
+                url, data=b'', method='POST', headers={'Authorization': f'Bearer {token}'}
+            )
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    code = response.status
+            except urllib.error.HTTPError as exc:
+                code = exc.code
+            return code, time.perf_counter() - started
+
+        return send
+
+    def _report(self, results, elapsed):
+        codes = Counter(code for code, _ in results)
+        latencies = sorted(latency for _, latency in results)
+        p50 = statistics.median(latencies)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(f"requests: {len(results)} in {elapsed:.2f}s ({len(results) / elapsed:.0f}/s)")
+        self.stdout.write(f"status codes: {dict(sorted(codes.items()))}")
+        self.stdout.write(f"latency p50 {p50 * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms")
+
+    def _check(self, job, results, applicants):
+        errors = sum(1 for code, _ in results if code >= 500)
+        created = sum(1 for code, _ in results if code == 201)
+        stored = Application.objects.filter(job=job).count()
+        job.refresh_from_db()
+
+        problems = []
+        if errors:
+            problems.append(f"{errors} server errors")
+        if created != applicants or stored != applicants:
+            problems.append(f"expected {applicants} applications, got {created} created / {stored} stored")
+        if job.applications_total != stored or job.applications_pending != stored:
+            problems.append(
+                f"counters drifted: total={job.applications_total} pending={job.applications_pending}"
+            )
+        if problems:
+            raise CommandError('; '.join(problems))
+        self.stdout.write(self.style.SUCCESS("No 5xx; one application per applicant; counters match."))
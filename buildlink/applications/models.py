@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from Users.models import User
 from projects.models import Job
 from django.utils.translation import gettext_lazy as _
@@ -21,7 +22,88 @@ class Application(models.Model):
 
     class Meta:
         unique_together = ('job', 'applicant')
+        indexes = [
+            models.Index(fields=['applicant', '-created_at', '-id'], name='app_applicant_created_idx'),
+            models.Index(fields=['job', '-created_at', '-id'], name='app_job_created_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so saves can move the job's counters.
+        if 'status' in instance.__dict__:
+            instance._stored_status = instance.status
+        return instance
 
     def __str__(self):
         return f"{self.applicant.full_name} applied to {self.job.title}"
-# Create your models here.
+
+
+class ApplicationEvent(models.Model):
+    """
+    Append-only record of one application status change, written in the
+    same transaction as the change itself.
+    """
+    class Source(models.TextChoices):
+        MANUAL = 'manual', _('Manual')
+        BULK = 'bulk', _('Bulk')
+        # Rejected by the system when the job was filled or expired.
+        AUTO = 'auto', _('Automatic')
+
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='events')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='application_events')
+    from_status = models.CharField(max_length=20, choices=Application.Status.choices)
+    to_status = models.CharField(max_length=20, choices=Application.Status.choices)
+    source = models.CharField(max_length=10, choices=Source.choices, default=Source.MANUAL)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['job', 'created_at'], name='app_event_job_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"Application {self.application_id}: {self.from_status} -> {self.to_status}"
+
+
+class DecisionStats(models.Model):
+    """
+    Running totals of owner decisions (pending -> accepted/rejected) with a
+    histogram of response times, so the median can be estimated without
+    keeping every sample. Maintained from the ApplicationEvent tail.
+    """
+    decided = models.PositiveIntegerField(default=0)
+    accepted = models.PositiveIntegerField(default=0)
+    # Count of decisions per log2(seconds) bucket; automatic rejections are
+    # counted in decided but have no response time.
+    response_histogram = models.JSONField(default=list)
+    median_response_seconds = models.FloatField(null=True, blank=True)
+    acceptance_rate = models.FloatField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class JobDecisionStats(DecisionStats):
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='decision_stats')
+
+    def __str__(self):
+        return f"Decision stats for job {self.job_id}"
+
+
+class OwnerDecisionStats(DecisionStats):
+    owner = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='decision_stats')
+
+    def __str__(self):
+        return f"Decision stats for owner {self.owner_id}"
+
+
+class EventLogCursor(models.Model):
+    """Last ApplicationEvent id folded into the decision stats, per consumer."""
+    name = models.CharField(max_length=50, unique=True)
+    last_event_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_event_id}"
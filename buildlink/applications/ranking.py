@@ -0,0 +1,98 @@
+import functools
+import operator
+import time
+from decimal import Decimal
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models import Case, Exists, F, FloatField, OuterRef, Q, Value, When
+from django.db.models.functions import Cast, Coalesce
+
+from trades.models import WorkerTrade
+
+from .models import Application
+
+# Points per signal. avg_rating is on a 0-5 scale, so it contributes up to 30.
+RANK_WEIGHTS = {
+    'trade': 40.0,
+    'rating': 6.0,
+    'verified': 20.0,
+    'location': 10.0,
+}
+# Profile edits (rating, trades, verification) do not bump the version,
+# so cached rankings are also bounded in age.
+RANKING_TTL = 600
+
+
+def _version_key(job_id):
+    return f'applications:applicant-set:{job_id}'
+
+
+def applicant_set_version(job_id):
+    key = _version_key(job_id)
+    version = cache.get(key)
+    if version is None:
+        # Time-based start so an evicted counter never reuses an old version.
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_applicant_set_version(job_id):
+    """Invalidate the job's cached ranking; call after applications are added or removed."""
+    key = _version_key(job_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def _points(condition, weight):
+    return Case(
+        When(condition, then=Value(weight)),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+def rank_score(job):
+    """Score expression for applications to `job`; higher ranks first."""
+    terms = [
+        Cast(Coalesce(F('applicant__avg_rating'), Value(Decimal('0'))), FloatField()) * Value(RANK_WEIGHTS['rating']),
+        _points(
+            Q(applicant__verified=True) | Q(applicant__national_id__isnull=False),
+            RANK_WEIGHTS['verified'],
+        ),
+    ]
+    if job.trade_id:
+        has_trade = Exists(WorkerTrade.objects.filter(user_id=OuterRef('applicant_id'), trade_id=job.trade_id))
+        terms.append(_points(has_trade, RANK_WEIGHTS['trade']))
+    if job.location:
+        terms.append(_points(Q(applicant__location__iexact=job.location), RANK_WEIGHTS['location']))
+    return functools.reduce(operator.add, terms)
+
+
+def ranked_applicants(job):
+    """
+    [(application_id, score)] for every application to `job`, best first,
+    computed in one annotated query and cached until the job's applicant set
+    changes (or RANKING_TTL passes). Not cached when the default cache is
+    local memory: version bumps would only reach the process that made them.
+    """
+    if isinstance(caches['default'], LocMemCache):
+        return _rank(job)
+    key = f'applications:ranking:{job.pk}:{applicant_set_version(job.pk)}'
+    ranked = cache.get(key)
+    if ranked is None:
+        ranked = _rank(job)
+        cache.set(key, ranked, RANKING_TTL)
+    return ranked
+
+
+def _rank(job):
+    return list(
+        Application.objects.filter(job=job)
+        .annotate(rank_score=rank_score(job))
+        .order_by('-rank_score', '-created_at', '-id')
+        .values_list('id', 'rank_score')
+    )
@@ -1,6 +1,9 @@
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
 from .models import Application
+from .services import AlreadyApplied, JobNotOpen, apply_to_job
 from projects.models import Job
+from projects.projections import Projection, DATETIME
 
 
 class ApplicationCreateSerializer(serializers.ModelSerializer):
@@ -11,24 +14,17 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
         fields = ['id', 'status']  # status is automatically 'pending' on creation
         read_only_fields = ['status']
 
-    def validate(self, attrs):
-        request = self.context['request']
-        job = self.context['job']
-
-        # Job must be open
-        if job.status == Job.Status.CLOSED:
-            raise serializers.ValidationError("You cannot apply to a closed job.")
-
-        # Prevent duplicate applications
-        if Application.objects.filter(job=job, applicant=request.user).exists():
-            raise serializers.ValidationError("You have already applied for this job.")
-
-        return attrs
-
     def create(self, validated_data):
-        job = self.context['job']
-        user = self.context['request'].user
-        return Application.objects.create(job=job, applicant=user, **validated_data)
+        """
+        Openness and duplicate checks happen inside the single INSERT done by
+        apply_to_job, so concurrent duplicates cannot slip past a pre-check.
+        """
+        try:
+            return apply_to_job(self.context['job_id'], self.context['request'].user)
+        except JobNotOpen:
+            raise NotFound("No Job matches the given query.")
+        except AlreadyApplied:
+            raise serializers.ValidationError({"non_field_errors": ["You have already applied for this job."]})
 
 
 class MyApplicationListSerializer(serializers.ModelSerializer):
@@ -46,6 +42,18 @@ class MyApplicationListSerializer(serializers.ModelSerializer):
         ]
 
 
+# Fast path for MyApplicationsView; same output as MyApplicationListSerializer.
+MY_APPLICATION_LIST_PROJECTION = Projection([
+    Projection.field('id'),
+    Projection.field('job_title', 'job__title'),
+    Projection.field('job_location', 'job__location'),
+    Projection.field('job_type', 'job__type'),
+    Projection.field('job_status', 'job__status'),
+    Projection.field('status'),
+    Projection.field('created_at', formatter=DATETIME),
+])
+
+
 class ApplicantForOwnerSerializer(serializers.ModelSerializer):
     """Serializer for job owners to view applications to their jobs."""
     applicant_name = serializers.CharField(source='applicant.full_name', read_only=True)
@@ -61,8 +69,63 @@ class ApplicantForOwnerSerializer(serializers.ModelSerializer):
         ]
 
 
+# Fast path for JobApplicationsForOwnerView; same output as ApplicantForOwnerSerializer.
+APPLICANT_FOR_OWNER_PROJECTION = Projection([
+    Projection.field('id'),
+    Projection.field('applicant_name', 'applicant__full_name'),
+    Projection.field('applicant_email', 'applicant__email'),
+    Projection.field('applicant_phone', 'applicant__phone'),
+    Projection.field('applicant_role', 'applicant__role'),
+    Projection.field('status'),
+    Projection.field('created_at', formatter=DATETIME),
+])
+
+
+# Flat rows for the streaming applicants export.
+APPLICANT_EXPORT_PROJECTION = Projection([
+    Projection.field('id'),
+    Projection.field('applicant_id'),
+    Projection.field('applicant_name', 'applicant__full_name'),
+    Projection.field('applicant_email', 'applicant__email'),
+    Projection.field('applicant_phone', 'applicant__phone'),
+    Projection.field('applicant_role', 'applicant__role'),
+    Projection.field('applicant_location', 'applicant__location'),
+    Projection.field('status'),
+    Projection.field('created_at', formatter=DATETIME),
+    Projection.field('updated_at', formatter=DATETIME),
+])
+
+
+class OwnerJobDashboardSerializer(serializers.ModelSerializer):
+    """One row of the owner dashboard: a posting and its application counts."""
+    total_applications = serializers.IntegerField(source='applications_total', read_only=True)
+    pending_applications = serializers.IntegerField(source='applications_pending', read_only=True)
+    accepted_applications = serializers.IntegerField(source='applications_accepted', read_only=True)
+    rejected_applications = serializers.IntegerField(source='applications_rejected', read_only=True)
+
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'title', 'location', 'type', 'status', 'created_at',
+            'total_applications', 'pending_applications',
+            'accepted_applications', 'rejected_applications'
+        ]
 
 
+# Fast path for MyJobPostingsView; same output as OwnerJobDashboardSerializer.
+OWNER_JOB_DASHBOARD_PROJECTION = Projection([
+    Projection.field('id'),
+    Projection.field('title'),
+    Projection.field('location'),
+    Projection.field('type'),
+    Projection.field('status'),
+    Projection.field('created_at', formatter=DATETIME),
+    Projection.field('total_applications', 'applications_total'),
+    Projection.field('pending_applications', 'applications_pending'),
+    Projection.field('accepted_applications', 'applications_accepted'),
+    Projection.field('rejected_applications', 'applications_rejected'),
+])
+
 
 class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -76,6 +139,22 @@ class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
         return value
 
 
+class BulkApplicationStatusSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
+    status = serializers.ChoiceField(choices=Application.Status.choices)
+    fill = serializers.BooleanField(
+        default=False,
+        help_text="Close the affected jobs and reject their remaining pending applications."
+    )
+
+    def validate(self, attrs):
+        if attrs['fill'] and attrs['status'] != Application.Status.ACCEPTED:
+            raise serializers.ValidationError("fill can only be used when accepting applications.")
+        return attrs
+
+
 class ApplicationDetailSerializer(serializers.ModelSerializer):
     """
     Serializer to return full details of an application.
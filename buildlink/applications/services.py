@@ -0,0 +1,161 @@
+from collections import Counter
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from projects.cache import bump_jobs_version
+from projects.facets import apply_rollup_deltas, rollup_deltas
+from projects.models import Job
+
+from .counters import apply_counter_deltas, counter_deltas
+from .events import EVENT_BATCH_SIZE, record_events
+from .models import Application, ApplicationEvent
+from .ranking import bump_applicant_set_version
+
+
+class JobNotOpen(Exception):
+    """The job does not exist, is closed, or is past its expires_at."""
+
+
+class AlreadyApplied(Exception):
+    pass
+
+
+# One statement: insert only while the job is open, and let the
+# (job, applicant) unique constraint turn duplicates into a no-op.
+APPLY_SQL = """
+    INSERT INTO {applications} (job_id, applicant_id, status, created_at, updated_at)
+    SELECT job.id, %s, %s, %s, %s
+    FROM {jobs} job
+    WHERE job.id = %s AND job.status = %s AND (job.expires_at IS NULL OR job.expires_at > %s)
+    ON CONFLICT (job_id, applicant_id) DO NOTHING
+    RETURNING id
+"""
+
+
+def apply_to_job(job_id, applicant):
+    """
+    Create a pending application for `applicant` on an open job in a single
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING, then bump the job's
+    counters. Only when nothing was inserted is the job looked up to tell a
+    closed job (JobNotOpen) from a duplicate (AlreadyApplied).
+    """
+    now = timezone.now()
+    stamp = connection.ops.adapt_datetimefield_value(now)
+    sql = APPLY_SQL.format(
+        applications=connection.ops.quote_name(Application._meta.db_table),
+        jobs=connection.ops.quote_name(Job._meta.db_table),
+    )
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [
+                applicant.pk, Application.Status.PENDING, stamp, stamp,
+                job_id, Job.Status.OPEN, stamp,
+            ])
+            row = cursor.fetchone()
+        if row is not None:
+            apply_counter_deltas(counter_deltas([(job_id, None, Application.Status.PENDING)]))
+            transaction.on_commit(lambda: bump_applicant_set_version(job_id))
+
+    if row is None:
+        is_open = Job.objects.filter(pk=job_id, status=Job.Status.OPEN).exclude(expires_at__lte=now).exists()
+        if not is_open:
+            raise JobNotOpen(job_id)
+        raise AlreadyApplied(job_id)
+
+    application = Application(
+        id=row[0], job_id=job_id, applicant=applicant,
+        status=Application.Status.PENDING, created_at=now, updated_at=now,
+    )
+    application._state.adding = False
+    application._stored_status = application.status
+    return application
+
+
+def close_jobs(jobs, now=None):
+    """
+    Close open jobs and reject their pending applications in bulk, logging
+    the rejections and adjusting application counters and facet rollups.
+    `jobs` is a list of (id, trade_id, type, location) rows for open jobs the
+    caller has locked. Returns {job_id: number of applications rejected}.
+    Must run inside a transaction.
+    """
+    now = now or timezone.now()
+    job_ids = [job[0] for job in jobs]
+
+    pending = list(
+        Application.objects.select_for_update()
+        .filter(job_id__in=job_ids, status=Application.Status.PENDING)
+        .values_list('id', 'job_id')
+    )
+    # Update exactly the rows that get an event, in bounded id lists.
+    pending_ids = [application_id for application_id, _ in pending]
+    for start in range(0, len(pending_ids), EVENT_BATCH_SIZE):
+        Application.objects.filter(id__in=pending_ids[start:start + EVENT_BATCH_SIZE]).update(
+            status=Application.Status.REJECTED, updated_at=now
+        )
+    record_events(
+        [(application_id, job_id, Application.Status.PENDING, Application.Status.REJECTED)
+         for application_id, job_id in pending],
+        ApplicationEvent.Source.AUTO, now,
+    )
+    rejected_by_job = Counter(job_id for _, job_id in pending)
+    apply_counter_deltas({
+        job_id: Counter(applications_pending=-n, applications_rejected=n)
+        for job_id, n in rejected_by_job.items()
+    })
+
+    Job.objects.filter(id__in=job_ids).update(status=Job.Status.CLOSED)
+    buckets = [(trade_id or 0, job_type, location) for _, trade_id, job_type, location in jobs]
+    apply_rollup_deltas(rollup_deltas(
+        old_keys=[bucket + (Job.Status.OPEN,) for bucket in buckets],
+        new_keys=[bucket + (Job.Status.CLOSED,) for bucket in buckets],
+    ))
+    transaction.on_commit(bump_jobs_version)
+    return rejected_by_job
+
+
+def bulk_transition(owner, ids, status, fill=False):
+    """
+    Move the owner's applications in `ids` to `status` with one UPDATE
+    restricted to jobs posted by `owner`. With fill=True the jobs of those
+    applications are closed and their other pending applications rejected,
+    all in the same transaction.
+    Returns {'updated', 'unchanged', 'not_found', 'closed_jobs', 'auto_rejected'}.
+    """
+    now = timezone.now()
+    ids = list(dict.fromkeys(ids))
+    with transaction.atomic():
+        owned = Application.objects.filter(id__in=ids, job__posted_by=owner)
+        rows = list(owned.select_for_update(of=('self',)).values_list('id', 'job_id', 'status'))
+        changed = [row for row in rows if row[2] != status]
+        if changed:
+            owned.exclude(status=status).update(status=status, updated_at=now)
+            apply_counter_deltas(counter_deltas(
+                (job_id, old_status, status) for _, job_id, old_status in changed
+            ))
+            record_events(
+                [(pk, job_id, old_status, status) for pk, job_id, old_status in changed],
+                ApplicationEvent.Source.BULK, now,
+            )
+
+        closed_jobs, auto_rejected = [], 0
+        if fill and rows:
+            jobs = list(
+                Job.objects.select_for_update()
+                .filter(id__in={job_id for _, job_id, _ in rows}, status=Job.Status.OPEN)
+                .values_list('id', 'trade_id', 'type', 'location')
+            )
+            if jobs:
+                auto_rejected = sum(close_jobs(jobs, now).values())
+                closed_jobs = [job[0] for job in jobs]
+
+    found = {row[0] for row in rows}
+    changed_ids = {row[0] for row in changed}
+    return {
+        'updated': [pk for pk in ids if pk in changed_ids],
+        'unchanged': [pk for pk in ids if pk in found and pk not in changed_ids],
+        'not_found': [pk for pk in ids if pk not in found],
+        'closed_jobs': closed_jobs,
+        'auto_rejected': auto_rejected,
+    }
@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .counters import apply_counter_deltas, counter_deltas
+from .events import record_events
+from .models import Application, ApplicationEvent
+from .ranking import bump_applicant_set_version
+
+
+@receiver(pre_save, sender=Application)
+def load_stored_status(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Instances not loaded through from_db need their stored status fetched.
+    if raw or instance.pk is None or hasattr(instance, '_stored_status'):
+        return
+    if update_fields is not None and 'status' not in update_fields:
+        return
+    instance._stored_status = Application.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+
+
+@receiver(post_save, sender=Application)
+def update_counters_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and 'status' not in update_fields):
+        return
+    if created:
+        old_status = None
+    else:
+        old_status = getattr(instance, '_stored_status', None)
+        if old_status is None:
+            return
+    apply_counter_deltas(counter_deltas([(instance.job_id, old_status, instance.status)]))
+    if not created:
+        record_events(
+            [(instance.pk, instance.job_id, old_status, instance.status)],
+            ApplicationEvent.Source.MANUAL, instance.updated_at,
+        )
+    instance._stored_status = instance.status
+
+
+@receiver(post_delete, sender=Application)
+def update_counters_on_delete(sender, instance, **kwargs):
+    old_status = getattr(instance, '_stored_status', None) or instance.status
+    apply_counter_deltas(counter_deltas([(instance.job_id, old_status, None)]))
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_applicant_ranking(sender, instance, created=True, raw=False, **kwargs):
+    # Status changes keep the applicant set; only additions and removals count.
+    if raw or not created:
+        return
+    job_id = instance.job_id
+    transaction.on_commit(lambda: bump_applicant_set_version(job_id))
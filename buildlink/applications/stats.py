@@ -0,0 +1,140 @@
+import datetime
+import itertools
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import (
+    Application,
+    ApplicationEvent,
+    EventLogCursor,
+    JobDecisionStats,
+    OwnerDecisionStats,
+)
+
+CURSOR_NAME = 'decision-stats'
+TAIL_BATCH_SIZE = 5000
+# Events younger than this are left for the next run, so a transaction
+# that allocated a lower id but committed later is not skipped.
+SETTLE_DELAY = datetime.timedelta(seconds=30)
+DECISIONS = {Application.Status.ACCEPTED, Application.Status.REJECTED}
+
+
+def response_bucket(seconds):
+    """Histogram bucket i holds response times in [2**i, 2**(i+1)) seconds."""
+    return max(int(seconds), 1).bit_length() - 1
+
+
+def histogram_median(histogram):
+    """Median estimated by linear interpolation inside the middle bucket."""
+    total = sum(histogram)
+    if not total:
+        return None
+    target = total / 2
+    seen = 0
+    for index, count in enumerate(histogram):
+        if count and seen + count >= target:
+            low = 2 ** index
+            return low + (target - seen) / count * low
+        seen += count
+    return None
+
+
+class _Totals:
+    __slots__ = ('decided', 'accepted', 'histogram')
+
+    def __init__(self):
+        self.decided = 0
+        self.accepted = 0
+        self.histogram = []
+
+    def add(self, to_status, seconds):
+        self.decided += 1
+        if to_status == Application.Status.ACCEPTED:
+            self.accepted += 1
+        if seconds is not None:
+            bucket = response_bucket(seconds)
+            if bucket >= len(self.histogram):
+                self.histogram.extend([0] * (bucket + 1 - len(self.histogram)))
+            self.histogram[bucket] += 1
+
+    def merge_into(self, stats):
+        stats.decided += self.decided
+        stats.accepted += self.accepted
+        histogram = list(stats.response_histogram or [])
+        if len(histogram) < len(self.histogram):
+            histogram.extend([0] * (len(self.histogram) - len(histogram)))
+        for bucket, count in enumerate(self.histogram):
+            histogram[bucket] += count
+        stats.response_histogram = histogram
+        stats.median_response_seconds = histogram_median(histogram)
+        stats.acceptance_rate = stats.accepted / stats.decided if stats.decided else None
+
+
+def _save_totals(model, key_field, totals):
+    existing = model.objects.select_for_update().in_bulk(list(totals))
+    now = timezone.now()
+    created, updated = [], []
+    for key, total in totals.items():
+        stats = existing.get(key)
+        if stats is None:
+            stats = model(**{key_field: key})
+            created.append(stats)
+        else:
+            updated.append(stats)
+        total.merge_into(stats)
+        # bulk_update does not apply auto_now.
+        stats.updated_at = now
+    model.objects.bulk_create(created)
+    model.objects.bulk_update(
+        updated,
+        ['decided', 'accepted', 'response_histogram', 'median_response_seconds', 'acceptance_rate', 'updated_at'],
+    )
+
+
+def refresh_decision_stats(batch_size=TAIL_BATCH_SIZE):
+    """
+    Fold ApplicationEvents past the cursor into the per-job and per-owner
+    decision stats, one batch per transaction. Only rows touched by the new
+    events are read or written; the log is never rescanned.
+    Returns the number of events consumed.
+    """
+    consumed = 0
+    while True:
+        with transaction.atomic():
+            EventLogCursor.objects.get_or_create(name=CURSOR_NAME)
+            cursor = EventLogCursor.objects.select_for_update().get(name=CURSOR_NAME)
+            fetched = list(
+                ApplicationEvent.objects.filter(id__gt=cursor.last_event_id)
+                .order_by('id')
+                .values_list(
+                    'id', 'job_id', 'job__posted_by_id', 'from_status', 'to_status',
+                    'source', 'created_at', 'application__created_at',
+                )[:batch_size]
+            )
+            # Stop at the first unsettled event; the cursor must never pass a gap.
+            cutoff = timezone.now() - SETTLE_DELAY
+            events = list(itertools.takewhile(lambda event: event[6] <= cutoff, fetched))
+            if not events:
+                break
+
+            by_job, by_owner = defaultdict(_Totals), defaultdict(_Totals)
+            for _, job_id, owner_id, from_status, to_status, source, decided_at, applied_at in events:
+                if from_status != Application.Status.PENDING or to_status not in DECISIONS:
+                    continue
+                seconds = None
+                if source != ApplicationEvent.Source.AUTO:
+                    seconds = (decided_at - applied_at).total_seconds()
+                by_job[job_id].add(to_status, seconds)
+                by_owner[owner_id].add(to_status, seconds)
+
+            _save_totals(JobDecisionStats, 'job_id', by_job)
+            _save_totals(OwnerDecisionStats, 'owner_id', by_owner)
+            cursor.last_event_id = events[-1][0]
+            cursor.save(update_fields=['last_event_id', 'updated_at'])
+
+        consumed += len(events)
+        if len(fetched) < batch_size or len(events) < len(fetched):
+            break
+    return consumed
@@ -0,0 +1,16 @@
+from celery import shared_task
+
+from .counters import reconcile_counters
+from .stats import refresh_decision_stats
+
+
+@shared_task
+def refresh_application_decision_stats():
+    """Fold new ApplicationEvents into the per-job and per-owner decision stats."""
+    return refresh_decision_stats()
+
+
+@shared_task
+def reconcile_application_counters():
+    """Correct drift in the Job application counters; returns the number of jobs fixed."""
+    return reconcile_counters()[1]
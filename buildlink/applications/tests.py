@@ -1,3 +1,158 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Users.models import User
+from applications.models import Application, ApplicationEvent
+from applications.tasks import reconcile_application_counters
+from projects.models import Job
+
+
+class ReconcileApplicationCountersTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            email='owner@example.com', full_name='Owner', phone='+250730000000', role=User.Roles.OWNER,
+        )
+        self.job = Job.objects.create(
+            posted_by=self.owner, title='Roofing', description='Roof repair.',
+            location='Kigali', type=Job.JobType.JOB,
+        )
+        workers = [
+            User.objects.create_user(
+                email=f'worker{i}@example.com', full_name=f'Worker {i}', phone=f'+25073100000{i}',
+                role=User.Roles.WORKER,
+            )
+            for i in range(3)
+        ]
+        # Rows written without the counters, like applications that predate them.
+        Application.objects.bulk_create([
+            Application(job=self.job, applicant=workers[0]),
+            Application(job=self.job, applicant=workers[1], status=Application.Status.ACCEPTED),
+            Application(job=self.job, applicant=workers[2], status=Application.Status.REJECTED),
+        ])
+
+    def dashboard_counts(self):
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        row = client.get(reverse('my-job-postings')).json()['results'][0]
+        return [row[key] for key in (
+            'total_applications', 'pending_applications', 'accepted_applications', 'rejected_applications',
+        )]
+
+    def test_command_fills_in_counters_for_existing_jobs(self):
+        self.assertEqual(self.dashboard_counts(), [0, 0, 0, 0])
+
+        call_command('reconcile_application_counters', '--dry-run', stdout=io.StringIO())
+        self.assertEqual(self.dashboard_counts(), [0, 0, 0, 0])
+
+        out = io.StringIO()
+        call_command('reconcile_application_counters', stdout=out)
+        self.assertIn('Checked 1 jobs; corrected drift on 1.', out.getvalue())
+        self.assertEqual(self.dashboard_counts(), [3, 1, 1, 1])
+
+    def test_nightly_task_is_idempotent(self):
+        self.assertEqual(reconcile_application_counters(), 1)
+        self.assertEqual(reconcile_application_counters(), 0)
+        self.assertEqual(self.dashboard_counts(), [3, 1, 1, 1])
+
+
+class RankedApplicantsTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            email='owner@example.com', full_name='Owner', phone='+250740000000', role=User.Roles.OWNER,
+        )
+        self.job = Job.objects.create(
+            posted_by=self.owner, title='Wiring', description='House wiring.',
+            location='Kigali', type=Job.JobType.JOB,
+        )
+        self.workers = [
+            User.objects.create_user(
+                email=f'electrician{i}@example.com', full_name=f'Electrician {i}', phone=f'+25074100000{i}',
+                role=User.Roles.WORKER,
+            )
+            for i in range(2)
+        ]
+
+    def apply(self, worker):
+        client = APIClient()
+        client.force_authenticate(worker)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post(reverse('job-apply', kwargs={'job_id': self.job.pk}))
+        self.assertEqual(response.status_code, 201)
+
+    def ranked_emails(self):
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        url = reverse('job-applications-for-owner', kwargs={'job_id': self.job.pk})
+        return sorted(row['applicant_email'] for row in client.get(url, {'ordering': 'rank'}).json()['results'])
+
+    def assert_new_applicant_is_ranked(self):
+        self.apply(self.workers[0])
+        self.assertEqual(self.ranked_emails(), ['electrician0@example.com'])
+        self.apply(self.workers[1])
+        self.assertEqual(self.ranked_emails(), ['electrician0@example.com', 'electrician1@example.com'])
+
+    def test_local_memory_cache_ranks_uncached(self):
+        # With a per-process cache the apply's version bump lands in another
+        # worker; model that by not bumping at all.
+        with mock.patch('applications.services.bump_applicant_set_version'):
+            self.assert_new_applicant_is_ranked()
+
+    def test_shared_cache_is_invalidated_by_apply(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        shared = {
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location},
+            'local': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'applications-tests'},
+        }
+        with override_settings(CACHES=shared):
+            self.addCleanup(caches['local'].clear)
+            self.assert_new_applicant_is_ranked()
+
+
+class ApplicationStatusUpdateTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            email='owner@example.com', full_name='Owner', phone='+250750000000', role=User.Roles.OWNER,
+        )
+        worker = User.objects.create_user(
+            email='painter@example.com', full_name='Painter', phone='+250750000001', role=User.Roles.WORKER,
+        )
+        self.job = Job.objects.create(
+            posted_by=self.owner, title='Painting', description='Paint walls.',
+            location='Kigali', type=Job.JobType.JOB,
+        )
+        self.application = Application.objects.create(job=self.job, applicant=worker)
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = reverse('application-status-update', kwargs={'pk': self.application.pk})
+
+    def counters(self):
+        self.job.refresh_from_db()
+        return [getattr(self.job, field) for field in Job.COUNTER_FIELDS]
+
+    def test_status_counters_and_event_are_written_together(self):
+        response = self.client.patch(self.url, {'status': 'accepted'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.counters(), [1, 0, 1, 0])
+        self.assertEqual(
+            list(ApplicationEvent.objects.values_list('application_id', 'from_status', 'to_status', 'source')),
+            [(self.application.pk, 'pending', 'accepted', ApplicationEvent.Source.MANUAL)],
+        )
+
+    def test_failed_event_write_rolls_back_status_and_counters(self):
+        with mock.patch('applications.signals.record_events', side_effect=RuntimeError('event log down')):
+            with self.assertRaises(RuntimeError):
+                self.client.patch(self.url, {'status': 'accepted'}, format='json')
+
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.status, Application.Status.PENDING)
+        self.assertEqual(self.counters(), [1, 1, 0, 0])
+        self.assertFalse(ApplicationEvent.objects.exists())
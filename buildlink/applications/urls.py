@@ -4,7 +4,9 @@ from .views import (
     MyApplicationsView,
     MyJobPostingsView,
     JobApplicationsForOwnerView,
-    ApplicationStatusUpdateView
+    JobApplicationsExportView,
+    ApplicationStatusUpdateView,
+    BulkApplicationStatusView,
 )
 
 urlpatterns = [
@@ -19,8 +21,14 @@ urlpatterns = [
 
     # Owner views applications for a specific job
     path('my-postings/<int:job_id>/applications/', JobApplicationsForOwnerView.as_view(), name='job-applications-for-owner'),
+
+    # Owner (or admin) streams all applicants of a job as CSV/NDJSON
+    path('my-postings/<int:job_id>/applications/export/', JobApplicationsExportView.as_view(), name='job-applications-export'),
     
     # Owner updates application status
     path('<int:pk>/', ApplicationStatusUpdateView.as_view(), name='application-status-update'),
 
+    # Owner accepts/rejects many applications at once, optionally filling the job
+    path('bulk-status/', BulkApplicationStatusView.as_view(), name='application-bulk-status'),
+
 ]
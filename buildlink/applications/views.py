@@ -1,29 +1,33 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.db import transaction
 from django.shortcuts import get_object_or_404
-from django.db.models import Count
-from rest_framework.pagination import PageNumberPagination
-from .serializers import ApplicationCreateSerializer, MyApplicationListSerializer, ApplicantForOwnerSerializer, ApplicationStatusUpdateSerializer, ApplicationDetailSerializer
+from .serializers import ApplicationCreateSerializer, MyApplicationListSerializer, ApplicantForOwnerSerializer, ApplicationStatusUpdateSerializer, ApplicationDetailSerializer, BulkApplicationStatusSerializer
 from .permissions import CanApplyToJob, IsApplicationJobOwner
 from drf_yasg.utils import swagger_auto_schema
 
 from .models import Application
 from projects.models import Job
+from projects.exports import export_format, export_response, id_range
+from projects.pagination import StandardResultsSetPagination
+from projects.permissions import IsJobOwner
+from .ranking import ranked_applicants
+from .services import bulk_transition
+from projects.projections import ProjectionListMixin
 from .serializers import (
     ApplicationCreateSerializer,
     MyApplicationListSerializer,
-    ApplicantForOwnerSerializer
+    ApplicantForOwnerSerializer,
+    OwnerJobDashboardSerializer,
+    MY_APPLICATION_LIST_PROJECTION,
+    APPLICANT_FOR_OWNER_PROJECTION,
+    OWNER_JOB_DASHBOARD_PROJECTION,
+    APPLICANT_EXPORT_PROJECTION,
 )
 from .permissions import CanApplyToJob
 
 
-class StandardResultsSetPagination(PageNumberPagination):
-    """Standard pagination for listing endpoints."""
-    page_size = 10
-    max_page_size = 50
-    page_size_query_param = 'page_size'
-
-
 # ---------------------------
 # Apply to a job
 # ---------------------------
@@ -43,18 +47,19 @@ class JobApplyView(generics.CreateAPIView):
         if getattr(self, 'swagger_fake_view', False):
             return {}
         
-        job_id = self.kwargs.get('job_id')
-        job = get_object_or_404(Job, pk=job_id, status=Job.Status.OPEN)
-        return {'request': self.request, 'job': job}
+        # The job is not loaded here; the apply INSERT checks it is open.
+        return {'request': self.request, 'job_id': self.kwargs.get('job_id')}
 
 
 # ---------------------------
 # View my applications
 # ---------------------------
-class MyApplicationsView(generics.ListAPIView):
+class MyApplicationsView(ProjectionListMixin, generics.ListAPIView):
     serializer_class = MyApplicationListSerializer
     permission_classes = [permissions.IsAuthenticated, CanApplyToJob]
     pagination_class = StandardResultsSetPagination
+    list_projection = MY_APPLICATION_LIST_PROJECTION
+    ordering = ['-created_at', '-id']
     
     @swagger_auto_schema(tags=["Applications"])
     def post(self, request, job_id=None, *args, **kwargs):
@@ -68,62 +73,114 @@ class MyApplicationsView(generics.ListAPIView):
     
       return Application.objects.filter(
             applicant=self.request.user
-        ).select_related('job').order_by('-created_at')
+        ).select_related('job').order_by('-created_at', '-id')
 
 
 # ---------------------------
 # View my posted jobs and their applicants
 # ---------------------------
-class MyJobPostingsView(generics.ListAPIView):
-    """Lists all jobs posted by the current user with application stats."""
+class MyJobPostingsView(ProjectionListMixin, generics.ListAPIView):
+    """
+    Owner dashboard: the current user's postings with total, pending,
+    accepted and rejected application counts, paginated. Counts are read
+    from the denormalized counters on Job, so no join or GROUP BY is needed;
+    jobs that predate the counters show correct counts once
+    reconcile_application_counters has run.
+    """
+    serializer_class = OwnerJobDashboardSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = StandardResultsSetPagination
-    
+    list_projection = OWNER_JOB_DASHBOARD_PROJECTION
+    ordering = ['-created_at', '-id']
+
     @swagger_auto_schema(tags=["Applications"])
-    def post(self, request, job_id=None, *args, **kwargs):
+    def get(self, request, *args, **kwargs):
         """
-        View my posted jobs and their applicants.
+        View my posted jobs and their application counts.
         """
-        return super().post(request, *args, **kwargs)
-   
+        return super().get(request, *args, **kwargs)
+
     def get_queryset(self):
-        return Job.objects.filter(posted_by=self.request.user).annotate(
-            total_applications=Count('applications')
-        ).order_by('-created_at')
+        if getattr(self, 'swagger_fake_view', False):
+            return Job.objects.none()
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        results = []
-        for job in queryset:
-            results.append({
-                'id': job.id,
-                'title': job.title,
-                'location': job.location,
-                'status': job.status,
-                'total_applications': job.total_applications,
-            })
-        return Response(results)
-
-
-class JobApplicationsForOwnerView(generics.ListAPIView):
-    """Lists all applications for a specific job by its owner."""
+        return Job.objects.filter(posted_by=self.request.user).order_by('-created_at', '-id')
+
+
+class OwnedJobMixin:
+    """Resolves `job_id` from the URL and enforces that the user posted it."""
+    allow_staff = False
+
+    def get_owned_job(self):
+        job = get_object_or_404(Job, pk=self.kwargs.get('job_id'))
+        if self.allow_staff and self.request.user.is_staff:
+            return job
+        if not IsJobOwner().has_object_permission(self.request, self, job):
+            self.permission_denied(
+                self.request,
+                message="You are not allowed to view applications for this job."
+            )
+        return job
+
+
+class JobApplicationsForOwnerView(OwnedJobMixin, ProjectionListMixin, generics.ListAPIView):
+    """
+    Lists all applications for a specific job by its owner, newest first.
+    With ?ordering=rank applicants are ordered by match score (trade, rating,
+    verification, location) and each row carries its `rank_score`.
+    """
     serializer_class = ApplicantForOwnerSerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = StandardResultsSetPagination
+    list_projection = APPLICANT_FOR_OWNER_PROJECTION
+    ordering = ['-created_at', '-id']
     
     
 
     def get_queryset(self):
-        job_id = self.kwargs.get('job_id')
-        job = get_object_or_404(Job, pk=job_id)
+        job = self.get_owned_job()
+        return Application.objects.filter(job=job).select_related('applicant').order_by('-created_at', '-id')
 
-        if job.posted_by != self.request.user:
-            self.permission_denied(
-                self.request,
-                message="You are not allowed to view applications for this job."
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('ordering') != 'rank':
+            return super().list(request, *args, **kwargs)
+        if self.paginator.use_cursor(request):
+            return Response(
+                {"detail": "Cursor pagination is not available with ordering=rank."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        return Application.objects.filter(job=job).select_related('applicant').order_by('-created_at')
+        # The ranking is cached as (id, score) pairs; only the page's rows are loaded.
+        page = self.paginate_queryset(ranked_applicants(self.get_owned_job()))
+        scores = dict(page)
+        projection = self.list_projection
+        rows = {
+            row['id']: row
+            for row in projection.serialize(projection.values(Application.objects.filter(id__in=scores)))
+        }
+        results = []
+        for application_id, score in page:
+            if application_id in rows:
+                rows[application_id]['rank_score'] = round(score, 2)
+                results.append(rows[application_id])
+        return self.get_paginated_response(results)
+
+
+class JobApplicationsExportView(OwnedJobMixin, APIView):
+    """
+    Stream a job's applicants as CSV or NDJSON (?output=csv|ndjson), ordered
+    by id. Open to the job owner and admins. Resume an interrupted export
+    with ?after_id=.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    allow_staff = True
+
+    @swagger_auto_schema(tags=["Applications"])
+    def get(self, request, job_id):
+        output = export_format(request)
+        job = self.get_owned_job()
+        applications = id_range(Application.objects.filter(job=job), request)
+        return export_response(applications, APPLICANT_EXPORT_PROJECTION, output, f'job-{job.pk}-applicants')
 
 
 
@@ -139,17 +196,42 @@ class ApplicationStatusUpdateView(generics.UpdateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsApplicationJobOwner]
 
     def patch(self, request, *args, **kwargs):
-        application = get_object_or_404(Application, pk=kwargs['pk'])
+        # The status UPDATE, the job counter deltas and the ApplicationEvent
+        # (written by applications.signals) commit together. The row lock
+        # keeps concurrent PATCHes from computing deltas off the same status.
+        with transaction.atomic():
+            application = get_object_or_404(
+                Application.objects.select_for_update(of=('self',)).select_related('job', 'applicant'),
+                pk=kwargs['pk'],
+            )
 
-        # Check permissions
-        self.check_object_permissions(request, application)
+            # Check permissions
+            self.check_object_permissions(request, application)
 
-        serializer = self.get_serializer(application, data=request.data, partial=True)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+            serializer = self.get_serializer(application, data=request.data, partial=True)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
 
         response_data = {
             "message": "Application status updated successfully.",
             "application": ApplicationDetailSerializer(application).data
         }
-        return Response(response_data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class BulkApplicationStatusView(APIView):
+    """
+    POST /api/applications/bulk-status/
+    Move many applications to one status at once. Only applications on jobs
+    the caller posted are touched; anything else is reported as not_found.
+    With "fill": true the affected jobs are closed and their other pending
+    applications rejected in the same transaction.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(tags=["Applications"], request_body=BulkApplicationStatusSerializer)
+    def post(self, request):
+        serializer = BulkApplicationStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = bulk_transition(request.user, **serializer.validated_data)
+        return Response(result, status=status.HTTP_200_OK)
@@ -14,6 +14,7 @@ from pathlib import Path
 import os
 import dj_database_url
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -117,6 +118,67 @@ DATABASES={
 }
 
 
+# Cache
+# Local memory by default; set REDIS_URL to share the cache between workers.
+# Caches invalidated across processes (auth users, job feed, applicant
+# ranking) are bypassed or kept for seconds only until REDIS_URL is set.
+# 'local' is always per-process and fronts 'default' for hot responses.
+REDIS_URL = config('REDIS_URL', default='')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'buildlink-default',
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'buildlink-local',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+if REDIS_URL:
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+
+
+# Celery
+# Tasks run inline when CELERY_TASK_ALWAYS_EAGER is set, which by default is
+# only in DEBUG with no broker configured (including test runs). Anywhere else
+# a broker is required: inline tasks would block requests and the beat
+# schedule below would never run.
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default=REDIS_URL)
+CELERY_TASK_ALWAYS_EAGER = config(
+    'CELERY_TASK_ALWAYS_EAGER', default=DEBUG and not CELERY_BROKER_URL, cast=bool
+)
+if not CELERY_BROKER_URL and not (DEBUG or CELERY_TASK_ALWAYS_EAGER):
+    raise ImproperlyConfigured(
+        "Set CELERY_BROKER_URL (or REDIS_URL), or CELERY_TASK_ALWAYS_EAGER, when DEBUG is off."
+    )
+CELERY_TASK_ACKS_LATE = True
+CELERY_TIMEZONE = 'UTC'
+CELERY_BEAT_SCHEDULE = {
+    'send-outbox': {
+        'task': 'notifications.tasks.send_outbox',
+        'schedule': 60.0,
+    },
+    'close-expired-jobs': {
+        'task': 'projects.tasks.close_expired_jobs',
+        'schedule': 300.0,
+    },
+    'refresh-decision-stats': {
+        'task': 'applications.tasks.refresh_application_decision_stats',
+        'schedule': 60.0,
+    },
+    'reconcile-application-counters': {
+        'task': 'applications.tasks.reconcile_application_counters',
+        'schedule': 24 * 60 * 60.0,
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -159,6 +221,14 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]
 
+# Uploaded media (portfolio originals and derivatives)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+PORTFOLIO_MAX_ITEMS = 200
+
+# Largest batch accepted by the bulk job import endpoint
+JOB_IMPORT_MAX_ROWS = 5000
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -167,6 +237,11 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'Users.User'
 
 REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'Users.authentication.CachedJWTAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+    ],
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend',
                                 'rest_framework.filters.OrderingFilter',
                                 'rest_framework.filters.SearchFilter'],
@@ -177,10 +252,12 @@ REST_FRAMEWORK = {
 
 
 # Email backend
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+# Override with e.g. django.core.mail.backends.locmem.EmailBackend for local runs.
+EMAIL_BACKEND = config('EMAIL_BACKEND', default="django.core.mail.backends.smtp.EmailBackend")
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
+EMAIL_TIMEOUT = 15
 EMAIL_HOST_USER = "nkejdavid@gmail.com"
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
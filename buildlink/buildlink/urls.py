@@ -14,6 +14,8 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework import permissions
@@ -38,6 +40,7 @@ urlpatterns = [
     path('api/', include('Users.urls')),
     path('api/', include('projects.urls', namespace='projects')),
     path('api/', include('applications.urls')),
+    path('api/', include('trades.urls')),
     path('api/applications/', include('applications.urls')),
     
     # Swagger UI
@@ -49,14 +52,4 @@ urlpatterns = [
     path('swagger.json', schema_view.without_ui(cache_timeout=0), name='swagger-json'),
 ]
 
-
-
-
-    
-
-
-
-
-
-
-
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -14,3 +14,16 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'buildlink.settings')
 
 application = get_wsgi_application()
+
+# Warm the revoked-token filter before serving; if the database is not
+# reachable yet it is warmed lazily on the first refresh instead.
+from django.db import DatabaseError, connections  # noqa: E402
+from Users.revocation import revoked_tokens  # noqa: E402
+
+try:
+    revoked_tokens.warm()
+except DatabaseError:
+    pass
+finally:
+    # Don't hand an open connection to forked workers (gunicorn --preload).
+    connections.close_all()
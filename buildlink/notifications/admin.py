@@ -1,5 +1,6 @@
 from django.contrib import admin
+from .models import OutboundEmail
 
-
+admin.site.register(OutboundEmail)
 
 # Register your models here.
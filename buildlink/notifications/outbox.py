@@ -0,0 +1,43 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def _kick_sender():
+    from .tasks import send_outbox
+
+    try:
+        send_outbox.delay()
+    except Exception:
+        # Broker unavailable: the periodic sweep will pick the rows up.
+        logger.warning("Could not schedule outbox delivery", exc_info=True)
+
+
+def enqueue_emails(messages):
+    """
+    Queue many emails at once. Each message is a dict with subject, body,
+    recipients and optionally from_email. Delivery starts after commit.
+    """
+    rows = OutboundEmail.objects.bulk_create([
+        OutboundEmail(
+            subject=message['subject'],
+            body=message['body'],
+            to=list(message['recipients']),
+            from_email=message.get('from_email') or settings.DEFAULT_FROM_EMAIL,
+        )
+        for message in messages
+    ])
+    if rows:
+        transaction.on_commit(_kick_sender)
+    return rows
+
+
+def enqueue_email(subject, body, recipients, from_email=None):
+    return enqueue_emails([{
+        'subject': subject, 'body': body, 'recipients': recipients, 'from_email': from_email,
+    }])[0]
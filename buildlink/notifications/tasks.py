@@ -0,0 +1,92 @@
+import datetime
+
+from celery import shared_task
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+BATCH_SIZE = 100
+MAX_ATTEMPTS = 8
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 6 * 60 * 60
+# How long a claimed batch is reserved before another worker may retry it.
+CLAIM_LEASE = datetime.timedelta(minutes=10)
+
+
+def _claim_batch(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=OutboundEmail.Status.PENDING) | Q(status=OutboundEmail.Status.SENDING),
+                next_attempt_at__lte=now,
+            )
+            .order_by('next_attempt_at')[:batch_size]
+        )
+        OutboundEmail.objects.filter(pk__in=[row.pk for row in rows]).update(
+            status=OutboundEmail.Status.SENDING, next_attempt_at=now + CLAIM_LEASE
+        )
+    return rows
+
+
+def _schedule_retry(row, error, now):
+    row.attempts += 1
+    row.last_error = str(error)[:2000]
+    if row.attempts >= MAX_ATTEMPTS:
+        row.status = OutboundEmail.Status.FAILED
+    else:
+        delay = min(BACKOFF_BASE_SECONDS * 2 ** (row.attempts - 1), BACKOFF_MAX_SECONDS)
+        row.status = OutboundEmail.Status.PENDING
+        row.next_attempt_at = now + datetime.timedelta(seconds=delay)
+
+
+@shared_task
+def send_outbox(batch_size=BATCH_SIZE):
+    """
+    Deliver due outbox rows over a single reused connection to the email
+    backend. Failed rows are retried with exponential backoff.
+    """
+    rows = _claim_batch(batch_size)
+    if not rows:
+        return 0
+
+    sent = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+        connection_error = None
+    except Exception as exc:
+        connection_error = exc
+
+    try:
+        for row in rows:
+            now = timezone.now()
+            if connection_error is not None:
+                _schedule_retry(row, connection_error, now)
+                continue
+            message = EmailMessage(
+                subject=row.subject, body=row.body, from_email=row.from_email or None,
+                to=row.to, connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as exc:
+                _schedule_retry(row, exc, now)
+            else:
+                row.status = OutboundEmail.Status.SENT
+                row.sent_at = now
+                sent += 1
+    finally:
+        if connection_error is None:
+            connection.close()
+        OutboundEmail.objects.bulk_update(
+            rows, ['status', 'attempts', 'last_error', 'next_attempt_at', 'sent_at']
+        )
+
+    if len(rows) == batch_size:
+        send_outbox.delay(batch_size)
+    return sent
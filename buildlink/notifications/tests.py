@@ -1,3 +1,122 @@
-from django.test import TestCase
+import datetime
+import smtplib
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from notifications.models import OutboundEmail
+from notifications.outbox import enqueue_email, enqueue_emails
+from notifications.tasks import BACKOFF_BASE_SECONDS, MAX_ATTEMPTS, _claim_batch, send_outbox
+
+
+def messages(count):
+    return [
+        {'subject': f'Subject {i}', 'body': 'Body', 'recipients': [f'user{i}@example.com']}
+        for i in range(count)
+    ]
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class EnqueueEmailTests(TestCase):
+    def test_enqueue_email_stores_a_pending_row(self):
+        with mock.patch.object(send_outbox, 'delay') as delay:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                row = enqueue_email('Welcome', 'Hello', ['new@example.com'])
+
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboundEmail.Status.PENDING)
+        self.assertEqual(row.to, ['new@example.com'])
+        self.assertEqual(row.from_email, settings.DEFAULT_FROM_EMAIL)
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(len(callbacks), 1)
+        delay.assert_not_called()
+
+    def test_delivery_starts_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            row = enqueue_email('Welcome', 'Hello', ['new@example.com'], from_email='team@example.com')
+
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboundEmail.Status.SENT)
+        self.assertIsNotNone(row.sent_at)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].from_email, 'team@example.com')
+        self.assertEqual(mail.outbox[0].to, ['new@example.com'])
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class SendOutboxTests(TestCase):
+    def test_batch_is_sent_over_one_connection_and_rest_rescheduled(self):
+        enqueue_emails(messages(5))
+        with mock.patch('notifications.tasks.get_connection', wraps=mail.get_connection) as get_connection, \
+                mock.patch.object(send_outbox, 'delay') as delay:
+            self.assertEqual(send_outbox(batch_size=2), 2)
+
+        get_connection.assert_called_once()
+        delay.assert_called_once_with(2)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.Status.PENDING).count(), 3)
+
+    def test_follow_up_batches_drain_the_outbox(self):
+        enqueue_emails(messages(5))
+        self.assertEqual(send_outbox(batch_size=2), 2)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertFalse(OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT).exists())
+
+    def test_failed_send_backs_off_exponentially(self):
+        row = enqueue_email('Welcome', 'Hello', ['new@example.com'])
+        with mock.patch('notifications.tasks.EmailMessage.send', side_effect=smtplib.SMTPException('down')):
+            for attempt in range(1, 3):
+                OutboundEmail.objects.filter(pk=row.pk).update(next_attempt_at=timezone.now())
+                before = timezone.now()
+                self.assertEqual(send_outbox(), 0)
+
+                row.refresh_from_db()
+                self.assertEqual(row.status, OutboundEmail.Status.PENDING)
+                self.assertEqual(row.attempts, attempt)
+                self.assertEqual(row.last_error, 'down')
+                delay = BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+                self.assertGreaterEqual(row.next_attempt_at, before + datetime.timedelta(seconds=delay))
+                self.assertLess(row.next_attempt_at, before + datetime.timedelta(seconds=delay + 5))
+
+        # Not due yet, so nothing is claimed.
+        self.assertEqual(send_outbox(), 0)
+        self.assertEqual(mail.outbox, [])
+
+    def test_gives_up_after_max_attempts(self):
+        row = enqueue_email('Welcome', 'Hello', ['new@example.com'])
+        OutboundEmail.objects.filter(pk=row.pk).update(attempts=MAX_ATTEMPTS - 1)
+        with mock.patch('notifications.tasks.EmailMessage.send', side_effect=smtplib.SMTPException('down')):
+            send_outbox()
+
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboundEmail.Status.FAILED)
+        self.assertEqual(row.attempts, MAX_ATTEMPTS)
+
+    def test_connection_failure_retries_the_whole_batch(self):
+        enqueue_emails(messages(3))
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=OSError('refused')):
+            self.assertEqual(send_outbox(), 0)
+
+        self.assertEqual(
+            list(OutboundEmail.objects.values_list('status', 'attempts', 'last_error').distinct()),
+            [(OutboundEmail.Status.PENDING, 1, 'refused')],
+        )
+
+    def test_expired_lease_is_reclaimed(self):
+        row = enqueue_email('Welcome', 'Hello', ['new@example.com'])
+        # A worker claims the row and dies before sending.
+        self.assertEqual([claimed.pk for claimed in _claim_batch(10)], [row.pk])
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboundEmail.Status.SENDING)
+
+        # While the lease holds, other workers leave it alone.
+        self.assertEqual(send_outbox(), 0)
+
+        OutboundEmail.objects.filter(pk=row.pk).update(next_attempt_at=timezone.now() - datetime.timedelta(seconds=1))
+        self.assertEqual(send_outbox(), 1)
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboundEmail.Status.SENT)
+        self.assertEqual(len(mail.outbox), 1)
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.serializers.json import DjangoJSONEncoder
+
+JOBS_VERSION_KEY = 'jobs:version'
+JOB_FEED_TTL = 300
+# Without a shared cache, other workers' version bumps are invisible, so
+# the local tier may only serve an entry this long.
+LOCAL_ONLY_TTL = 5
+
+
+def _shared():
+    return caches['default']
+
+
+def _new_version():
+    # Time-based so an evicted counter never restarts at a version that
+    # still has entries cached somewhere.
+    return int(time.time() * 1000)
+
+
+def jobs_version():
+    cache = _shared()
+    version = cache.get(JOBS_VERSION_KEY)
+    if version is None:
+        cache.add(JOBS_VERSION_KEY, _new_version(), timeout=None)
+        version = cache.get(JOBS_VERSION_KEY)
+    return version
+
+
+def bump_jobs_version():
+    """
+    Invalidate every cached job feed response in O(1): cached entries are
+    keyed by version, so old ones simply stop being read and expire.
+    """
+    cache = _shared()
+    try:
+        cache.incr(JOBS_VERSION_KEY)
+    except ValueError:
+        cache.set(JOBS_VERSION_KEY, _new_version(), timeout=None)
+
+
+def feed_cache_key(request, version):
+    params = sorted(
+        (key, sorted(value for value in request.query_params.getlist(key) if value))
+        for key in request.query_params
+    )
+    params = [(key, values) for key, values in params if values]
+    # Host is part of the key because pagination links are absolute.
+    raw = json.dumps([request.get_host(), request.path, params])
+    return f"jobs:feed:{version}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def make_etag(data):
+    payload = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, separators=(',', ':'))
+    return f'"{hashlib.sha1(payload.encode()).hexdigest()}"'
+
+
+def etag_matches(request, etag):
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(',')]
+    # If-None-Match uses weak comparison.
+    return '*' in candidates or etag in [tag[2:] if tag.startswith('W/') else tag for tag in candidates]
+
+
+class TieredResponseCache:
+    """
+    Two-tier cache for rendered-ready response data: a per-process
+    local-memory tier in front of the shared default cache.
+
+    Entries are keyed by jobs_version(), which is only seen by every worker
+    and Celery when it lives in a shared cache (set REDIS_URL). When the
+    default cache is local memory a bump elsewhere would go unnoticed, so
+    only the local tier is used and entries expire after LOCAL_ONLY_TTL.
+    """
+
+    def __init__(self, timeout=JOB_FEED_TTL):
+        self.timeout = timeout
+
+    def _tiers(self):
+        shared = _shared()
+        if isinstance(shared, LocMemCache):
+            return caches['local'], None, LOCAL_ONLY_TTL
+        return caches['local'], shared, self.timeout
+
+    def get(self, key):
+        local, shared, timeout = self._tiers()
+        entry = local.get(key)
+        if entry is None and shared is not None:
+            entry = shared.get(key)
+            if entry is not None:
+                local.set(key, entry, timeout)
+        return entry
+
+    def set(self, key, data):
+        entry = {'etag': make_etag(data), 'data': data}
+        local, shared, timeout = self._tiers()
+        local.set(key, entry, timeout)
+        if shared is not None:
+            shared.set(key, entry, timeout)
+        return entry
+
+
+job_feed_cache = TieredResponseCache()
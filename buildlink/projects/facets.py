@@ -0,0 +1,130 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from trades.models import Trade
+
+from .models import Job, JobRollup
+
+FACET_DIMENSIONS = ('trade', 'type', 'location')
+ROLLUP_KEY_FIELDS = ('trade_key', 'type', 'location', 'status')
+
+
+def _bucket(key):
+    return dict(zip(ROLLUP_KEY_FIELDS, key))
+
+
+def apply_rollup_deltas(deltas):
+    """
+    Add {rollup_key: delta} to the JobRollup counters with F() updates,
+    creating missing buckets. Call inside the transaction that changed the jobs.
+    """
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        bucket = JobRollup.objects.filter(**_bucket(key))
+        if not bucket.update(count=F('count') + delta):
+            JobRollup.objects.bulk_create([JobRollup(**_bucket(key))], ignore_conflicts=True)
+            bucket.update(count=F('count') + delta)
+
+
+def rollup_deltas(old_keys=(), new_keys=()):
+    deltas = Counter(new_keys)
+    deltas.subtract(Counter(old_keys))
+    return deltas
+
+
+def merge_trade_rollups(trade_id):
+    """Fold a deleted trade's buckets into the no-trade buckets, as SET_NULL does to the jobs."""
+    with transaction.atomic():
+        rows = list(JobRollup.objects.select_for_update().filter(trade_key=trade_id))
+        apply_rollup_deltas({(0, row.type, row.location, row.status): row.count for row in rows})
+        JobRollup.objects.filter(pk__in=[row.pk for row in rows]).delete()
+
+
+def rebuild_job_rollups():
+    """Recompute every bucket from the jobs table."""
+    grouped = (
+        Job.objects.order_by()
+        .values('trade_id', 'type', 'location', 'status')
+        .annotate(n=Count('id'))
+    )
+    with transaction.atomic():
+        JobRollup.objects.all().delete()
+        JobRollup.objects.bulk_create(
+            [
+                JobRollup(
+                    trade_key=row['trade_id'] or 0, type=row['type'],
+                    location=row['location'], status=row['status'], count=row['n'],
+                )
+                for row in grouped
+            ],
+            batch_size=1000,
+        )
+
+
+def rollup_rows(status, now):
+    """
+    (trade_key, type, location, count) rows from JobRollup. Open jobs already
+    past expires_at but not yet closed by close_expired_jobs are subtracted,
+    so the counts agree with the feed; that correction only reads the
+    job_open_expires_idx range.
+    """
+    rows = JobRollup.objects.filter(status=status, count__gt=0).values_list(
+        'trade_key', 'type', 'location', 'count'
+    )
+    if status != Job.Status.OPEN:
+        return rows
+    expired = Counter()
+    for trade_key, job_type, location, n in job_rows(
+        Job.objects.filter(status=Job.Status.OPEN, expires_at__lte=now)
+    ):
+        expired[trade_key, job_type, location] += n
+    return [
+        (trade_key, job_type, location, count - expired[trade_key, job_type, location])
+        for trade_key, job_type, location, count in rows
+        if count > expired[trade_key, job_type, location]
+    ]
+
+
+def job_rows(queryset):
+    """Same shape as rollup_rows, grouped from an already filtered Job queryset."""
+    return (
+        (trade_id or 0, job_type, location, n)
+        for trade_id, job_type, location, n in queryset.order_by()
+        .values_list('trade_id', 'type', 'location')
+        .annotate(n=Count('id'))
+    )
+
+
+def facet_counts(rows, selected):
+    """
+    Aggregate (trade_key, type, location, count) rows into facet counts.
+
+    Each dimension's counts apply every selected filter except its own, so
+    they show what choosing another value would return. `total` applies all
+    filters.
+    """
+    facets = {dimension: Counter() for dimension in FACET_DIMENSIONS}
+    total = 0
+    for trade_key, job_type, location, count in rows:
+        values = {'trade': trade_key, 'type': job_type, 'location': location}
+        misses = [dimension for dimension, value in selected.items() if values[dimension] != value]
+        if not misses:
+            total += count
+            for dimension in FACET_DIMENSIONS:
+                facets[dimension][values[dimension]] += count
+        elif len(misses) == 1:
+            facets[misses[0]][values[misses[0]]] += count
+
+    trade_names = dict(Trade.objects.filter(id__in=list(facets['trade'])).values_list('id', 'name'))
+    return {
+        'total': total,
+        'trade': [
+            {'id': trade_id, 'name': trade_names.get(trade_id), 'count': count}
+            for trade_id, count in facets['trade'].most_common() if trade_id
+        ],
+        'type': [{'value': value, 'count': count} for value, count in facets['type'].most_common()],
+        'location': [{'value': value, 'count': count} for value, count in facets['location'].most_common()],
+    }
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+
+from django.db import transaction
+from rest_framework import serializers
+
+from trades.models import Trade
+
+from .cache import bump_jobs_version
+from .facets import apply_rollup_deltas, rollup_deltas
+from .models import Job
+from .serializers import JobCreateUpdateSerializer
+
+CHUNK_SIZE = 500
+
+
+class JobImportError(ValueError):
+    pass
+
+
+def parse_job_rows(content, fmt):
+    """
+    Turn an uploaded CSV or JSON array into a list of dicts. Empty CSV cells
+    are dropped so optional fields fall back to their defaults.
+    """
+    if isinstance(content, bytes):
+        content = content.decode('utf-8-sig')
+
+    if fmt == 'csv':
+        return [
+            {key: value for key, value in record.items() if key and value not in ('', None)}
+            for record in csv.DictReader(io.StringIO(content))
+        ]
+    if fmt == 'json':
+        try:
+            rows = json.loads(content)
+        except ValueError as exc:
+            raise JobImportError(f"Invalid JSON: {exc}")
+        if not isinstance(rows, list):
+            raise JobImportError("Expected a JSON array of jobs.")
+        return rows
+    raise JobImportError(f"Unsupported format: {fmt}")
+
+
+def validate_job_rows(rows):
+    """
+    Validate every row with one JobCreateUpdateSerializer instance and check
+    all referenced trades with a single query.
+    Returns (valid, errors): valid is a list of (row_number, validated_data),
+    errors a list of {'row': n, 'errors': {...}}. Row numbers start at 1.
+    """
+    serializer = JobCreateUpdateSerializer()
+    valid, errors = [], []
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({'row': number, 'errors': {'non_field_errors': ["Expected an object."]}})
+            continue
+        try:
+            valid.append((number, serializer.run_validation(row)))
+        except serializers.ValidationError as exc:
+            errors.append({'row': number, 'errors': serializers.as_serializer_error(exc)})
+
+    trade_ids = {data['trade_id'] for _, data in valid if data.get('trade_id')}
+    known = set(Trade.objects.filter(id__in=trade_ids).values_list('id', flat=True))
+    if known != trade_ids:
+        checked = []
+        for number, data in valid:
+            if data.get('trade_id') and data['trade_id'] not in known:
+                errors.append({'row': number, 'errors': {'trade_id': ["Trade not found."]}})
+            else:
+                checked.append((number, data))
+        valid = checked
+        errors.sort(key=lambda error: error['row'])
+    return valid, errors
+
+
+def import_jobs(rows, owner, chunk_size=CHUNK_SIZE):
+    """
+    Validate `rows` and insert the valid ones for `owner` with chunked
+    bulk_create in a single transaction. Invalid rows are reported, not
+    raised, so they never block the good ones.
+    Returns (created_jobs, errors).
+    """
+    valid, errors = validate_job_rows(rows)
+    jobs = []
+    for _, data in valid:
+        data = dict(data)
+        trade_id = data.pop('trade_id', None)
+        jobs.append(Job(posted_by=owner, trade_id=trade_id or None, **data))
+
+    if jobs:
+        with transaction.atomic():
+            jobs = Job.objects.bulk_create(jobs, batch_size=chunk_size)
+            # bulk_create skips post_save, so update rollups and the feed here.
+            apply_rollup_deltas(rollup_deltas(new_keys=[job.rollup_key() for job in jobs]))
+            transaction.on_commit(bump_jobs_version)
+    return jobs, errors
@@ -0,0 +1,91 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from Users.models import User
+from projects.models import Job
+from projects.search import full_text_search, full_text_vendor, search_tokens
+
+BENCH_EMAIL = 'bench-search@buildlink.local'
+WORDS = [
+    'plumber', 'electrician', 'carpenter', 'painter', 'mason', 'roofer', 'welder',
+    'tiles', 'foundation', 'renovation', 'kitchen', 'bathroom', 'wiring', 'drainage',
+    'scaffolding', 'concrete', 'plaster', 'framing', 'insulation', 'solar', 'fence',
+]
+LOCATIONS = ['Kigali', 'Musanze', 'Huye', 'Rubavu', 'Rwamagana', 'Nyagatare', 'Muhanga']
+QUERIES = ['plumb', 'kitchen renovation', 'solar wiring', 'kigali concrete', 'roof']
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic open jobs and compare ILIKE search (the old SearchFilter) "
+        "with the full-text backend. Reports median latency per query."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--keep', action='store_true', help="Keep the seeded jobs afterwards.")
+
+    def handle(self, *args, **options):
+        owner = self._seed(options['rows'], options['batch_size'])
+        vendor = full_text_vendor()
+        self.stdout.write(f"full-text backend: {vendor or 'unavailable'}")
+
+        base = Job.objects.filter(status=Job.Status.OPEN)
+        for text in QUERIES:
+            ilike = self._time(options['repeat'], lambda: self._ilike(base, text))
+            line = f"{text!r:24} ilike {ilike * 1000:8.1f} ms"
+            if vendor:
+                fts = self._time(options['repeat'], lambda: self._fts(base, text))
+                line += f" | full-text {fts * 1000:8.1f} ms | {ilike / fts:6.1f}x"
+            self.stdout.write(line)
+
+        if not options['keep']:
+            owner.delete()
+
+    def _seed(self, rows, batch_size):
+        owner, _ = User.objects.get_or_create(
+            email=BENCH_EMAIL,
+            defaults={'full_name': 'Bench Search', 'phone': '+000search', 'role': User.Roles.COMPANY},
+        )
+        existing = Job.objects.filter(posted_by=owner).count()
+        rng = random.Random(42)
+        for start in range(existing, rows, batch_size):
+            Job.objects.bulk_create([
+                Job(
+                    posted_by=owner,
+                    title=' '.join(rng.sample(WORDS, 3)).title(),
+                    description=' '.join(rng.choices(WORDS, k=40)),
+                    location=rng.choice(LOCATIONS),
+                    type=Job.JobType.JOB,
+                )
+                for _ in range(min(batch_size, rows - start))
+            ])
+            self.stdout.write(f"seeded {min(start + batch_size, rows)}/{rows}", ending='\r')
+        self.stdout.write('')
+        return owner
+
+    def _time(self, repeat, run):
+        run()
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            samples.append(time.perf_counter() - started)
+        return statistics.median(samples)
+
+    def _ilike(self, base, text):
+        query = Q()
+        for term in text.split():
+            query &= Q(title__icontains=term) | Q(description__icontains=term) | Q(location__icontains=term)
+        queryset = base.filter(query)
+        return queryset.count(), list(queryset.order_by('-created_at').values_list('id', flat=True)[:10])
+
+    def _fts(self, base, text):
+        queryset = full_text_search(base, search_tokens(text))
+        return queryset.count(), list(queryset.order_by('-search_rank', '-created_at').values_list('id', flat=True)[:10])
@@ -0,0 +1,62 @@
+import datetime
+import decimal
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from Users.models import User
+from trades.models import Trade
+from projects.models import Job
+from projects.serializers import JobListSerializer, JOB_LIST_PROJECTION
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark job list serialization: JobListSerializer over model "
+        "instances vs JOB_LIST_PROJECTION over .values() rows. No database needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 500])
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        for size in options['sizes']:
+            instances, rows = self._fixtures(size)
+
+            expected = JobListSerializer(instances, many=True).data
+            if [dict(item) for item in expected] != JOB_LIST_PROJECTION.serialize(rows):
+                self.stderr.write(self.style.ERROR(f"output mismatch at page size {size}"))
+
+            drf = self._per_row(lambda: JobListSerializer(instances, many=True).data, size, options['repeat'])
+            fast = self._per_row(lambda: JOB_LIST_PROJECTION.serialize(rows), size, options['repeat'])
+            self.stdout.write(
+                f"page size {size:4}: serializer {drf:7.1f} us/row | projection {fast:6.1f} us/row "
+                f"| {drf / fast:5.1f}x"
+            )
+
+    def _per_row(self, run, size, repeat):
+        best = min(timeit.repeat(run, number=1, repeat=repeat))
+        return best / size * 1_000_000
+
+    def _fixtures(self, size):
+        owner = User(id=1, full_name='Bench Owner', role=User.Roles.COMPANY, email='owner@buildlink.local')
+        trade = Trade(id=1, name='plumber')
+        created = timezone.now()
+        instances, rows = [], []
+        for i in range(size):
+            job = Job(
+                id=i + 1, title=f"Job {i}", location='Kigali', type=Job.JobType.JOB,
+                trade=trade if i % 3 else None, budget=decimal.Decimal('1500.00') if i % 2 else None,
+                status=Job.Status.OPEN, posted_by=owner,
+                created_at=created - datetime.timedelta(minutes=i),
+            )
+            instances.append(job)
+            rows.append({
+                'id': job.id, 'title': job.title, 'location': job.location, 'type': job.type,
+                'trade__name': trade.name if job.trade_id else None, 'budget': job.budget,
+                'status': job.status, 'posted_by__id': owner.id, 'posted_by__full_name': owner.full_name,
+                'posted_by__role': owner.role, 'posted_by__email': owner.email, 'created_at': job.created_at,
+            })
+        return instances, rows
@@ -0,0 +1,45 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from Users.models import User
+from projects.imports import JobImportError, import_jobs, parse_job_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Import job postings for one owner from a CSV file or JSON array. "
+        "Valid rows are inserted with chunked bulk_create in one transaction; "
+        "invalid rows are listed with their row number and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--owner', required=True, help="Email of the posting owner or company.")
+        parser.add_argument('--format', choices=['csv', 'json'], help="Defaults to the file extension.")
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f"File not found: {path}")
+
+        owner = User.objects.filter(email=options['owner']).first()
+        if owner is None:
+            raise CommandError(f"No user with email {options['owner']}")
+        if owner.role not in ['owner', 'company']:
+            raise CommandError("Only owners and companies can post jobs.")
+
+        fmt = options['format'] or ('json' if path.lower().endswith('.json') else 'csv')
+        with open(path, 'rb') as handle:
+            try:
+                rows = parse_job_rows(handle.read(), fmt)
+            except JobImportError as exc:
+                raise CommandError(str(exc))
+
+        jobs, errors = import_jobs(rows, owner, chunk_size=options['chunk_size'])
+        for error in errors:
+            self.stderr.write(f"row {error['row']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {len(jobs)} of {len(rows)} jobs ({len(errors)} rejected)."
+        ))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from projects.facets import rebuild_job_rollups
+from projects.models import JobRollup
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the JobRollup facet counters from the jobs table. Run after "
+        "raw SQL edits or fixture loads, which bypass the Job signals."
+    )
+
+    def handle(self, *args, **options):
+        rebuild_job_rollups()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {JobRollup.objects.count()} rollup buckets."))
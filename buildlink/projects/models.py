@@ -21,9 +21,95 @@ class Job(models.Model):
     budget = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.OPEN)
     created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    # Denormalized application counts, maintained with F() updates by the
+    # applications app. Never written by a plain save().
+    applications_total = models.IntegerField(default=0)
+    applications_pending = models.IntegerField(default=0)
+    applications_accepted = models.IntegerField(default=0)
+    applications_rejected = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', '-created_at', '-id'], name='job_status_created_idx'),
+            models.Index(fields=['trade', 'location', 'status', 'type'], name='job_filter_idx'),
+            models.Index(fields=['posted_by', '-created_at'], name='job_owner_created_idx'),
+            # The public feed only ever reads open jobs.
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='job_open_created_idx',
+                condition=models.Q(status='open'),
+            ),
+            models.Index(
+                fields=['trade', 'location', 'type'],
+                name='job_open_filter_idx',
+                condition=models.Q(status='open'),
+            ),
+            # Scanned by the periodic auto-close task.
+            models.Index(
+                fields=['expires_at'],
+                name='job_open_expires_idx',
+                condition=models.Q(status='open', expires_at__isnull=False),
+            ),
+        ]
+
+    # Fields that make up a job's JobRollup bucket.
+    ROLLUP_FIELDS = ('trade_id', 'type', 'location', 'status')
+    COUNTER_FIELDS = (
+        'applications_total', 'applications_pending', 'applications_accepted', 'applications_rejected',
+    )
+
+    def save(self, *args, **kwargs):
+        # Saving a loaded instance must not write back stale counters.
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored bucket so saves can move the job between rollups.
+        if all(name in instance.__dict__ for name in cls.ROLLUP_FIELDS):
+            instance._rollup_key = instance.rollup_key()
+        return instance
+
+    def rollup_key(self):
+        return (self.trade_id or 0, self.type, self.location, self.status)
+
+    @staticmethod
+    def unexpired(now):
+        """Q for jobs not past expires_at, the rule APPLY_SQL enforces."""
+        return models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=now)
 
     def __str__(self):
         return f"{self.title} - {self.type}"
+
+
+class JobRollup(models.Model):
+    """
+    Number of jobs per (trade, type, location, status) bucket, kept current
+    by Job signals and the bulk job paths. Serves facet counts without
+    scanning the jobs table. trade_key is 0 for jobs without a trade.
+    """
+    trade_key = models.IntegerField()
+    type = models.CharField(max_length=20)
+    location = models.CharField(max_length=100)
+    status = models.CharField(max_length=20)
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['trade_key', 'type', 'location', 'status'], name='job_rollup_bucket_uniq'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.trade_key}/{self.type}/{self.location}/{self.status}: {self.count}"
     
     
     
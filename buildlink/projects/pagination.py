@@ -0,0 +1,82 @@
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.core.exceptions import EmptyResultSet
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+COUNT_CACHE_TTL = 60
+
+
+def cached_count(queryset):
+    """
+    COUNT(*) for a queryset, cached for COUNT_CACHE_TTL seconds by its SQL.
+    Counts can lag writes by up to the TTL; pages themselves never do.
+    """
+    try:
+        sql = str(queryset.query)
+    except EmptyResultSet:
+        return 0
+    key = f"pagination:count:{hashlib.sha1(sql.encode()).hexdigest()}"
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, COUNT_CACHE_TTL)
+    return count
+
+
+class CachedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            return cached_count(self.object_list)
+        return super().count
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Keyset pagination on (created_at, id), newest first."""
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    ordering = ('-created_at', '-id')
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    """
+    Standard pagination for listing endpoints.
+
+    Page numbers by default, with a cached total count. Pass ?pagination=cursor
+    (or follow a returned ?cursor= link) to switch to keyset pagination on
+    (created_at, id), which stays fast on deep pages. Views using cursor mode
+    should set `ordering = ['-created_at', '-id']`.
+    """
+    django_paginator_class = CachedCountPaginator
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    cursor_pagination_class = CreatedAtCursorPagination
+
+    def use_cursor(self, request):
+        cursor_param = self.cursor_pagination_class.cursor_query_param
+        return request.query_params.get('pagination') == 'cursor' or cursor_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if not self.use_cursor(request):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.cursor_paginator = self.cursor_pagination_class()
+        self.cursor_count = cached_count(queryset)
+        return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is None:
+            return super().get_paginated_response(data)
+        return Response({
+            'count': self.cursor_count,
+            'next': self.cursor_paginator.get_next_link(),
+            'previous': self.cursor_paginator.get_previous_link(),
+            'results': data,
+        })
@@ -0,0 +1,92 @@
+from rest_framework import serializers
+from rest_framework.response import Response
+
+
+class Projection:
+    """
+    Read-only fast path for list endpoints.
+
+    Describes a response row as (output_key, values_lookup) pairs, with an
+    optional DRF field used only for value formatting, or a nested
+    Projection. Rows are fetched with queryset.values() and turned into
+    dicts by a row function compiled once, so no model instances or
+    per-row serializer fields are involved. Output matches the equivalent
+    ModelSerializer.
+
+    Fields reached through a nullable relation can set omit_none=True to
+    mirror DRF, which drops a `source='rel.attr'` field when `rel` is null.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.lookups = tuple(self._lookups(fields))
+        self.row = self._compile()
+
+    @staticmethod
+    def field(key, lookup=None, formatter=None, omit_none=False):
+        return (key, lookup or key, formatter, omit_none)
+
+    def _lookups(self, fields):
+        for key, lookup, formatter, omit_none in fields:
+            if isinstance(lookup, Projection):
+                yield from lookup.lookups
+            else:
+                yield lookup
+
+    def _compile(self):
+        namespace = {}
+        lines = ['def row(r):']
+        omitted = []
+
+        def expr(fields, prefix):
+            parts = []
+            for index, (key, lookup, formatter, omit_none) in enumerate(fields):
+                name = f'{prefix}_{index}'
+                if isinstance(lookup, Projection):
+                    value = expr(lookup.fields, name)
+                elif formatter is not None:
+                    namespace[name] = formatter.to_representation
+                    lines.append(f'    v{name} = r[{lookup!r}]')
+                    value = f'(None if v{name} is None else {name}(v{name}))'
+                else:
+                    value = f'r[{lookup!r}]'
+                if omit_none and prefix == 'f':
+                    omitted.append(key)
+                parts.append(f'{key!r}: {value}')
+            return '{' + ', '.join(parts) + '}'
+
+        body = expr(self.fields, 'f')
+        lines.append(f'    d = {body}')
+        for key in omitted:
+            lines.append(f'    if d[{key!r}] is None: del d[{key!r}]')
+        lines.append('    return d')
+        exec('\n'.join(lines), namespace)
+        return namespace['row']
+
+    def values(self, queryset):
+        return queryset.values(*self.lookups)
+
+    def serialize(self, rows):
+        row = self.row
+        return [row(r) for r in rows]
+
+
+# Formatters shared by projections; same output as the serializer fields.
+DATETIME = serializers.DateTimeField()
+MONEY = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+class ProjectionListMixin:
+    """
+    ListModelMixin replacement that serializes pages through `list_projection`.
+    """
+    list_projection = None
+
+    def list(self, request, *args, **kwargs):
+        projection = self.list_projection
+        rows = projection.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(projection.serialize(page))
+        return Response(projection.serialize(rows))
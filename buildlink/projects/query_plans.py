@@ -0,0 +1,117 @@
+"""
+EXPLAIN checks for the main query of each hot endpoint: none of them may
+read a core table with a sequential scan. Used by projects.tests and the
+check_query_plans command.
+"""
+import random
+import re
+
+from django.db import connection
+
+from Users.models import User
+from applications.models import Application
+from projects.models import Job
+from trades.models import Trade, WorkerTrade
+
+SEED_DOMAIN = 'plan-check.buildlink.local'
+LOCATIONS = ['Kigali', 'Musanze', 'Huye', 'Rubavu', 'Rwamagana']
+
+# Postgres: "Seq Scan on projects_job". SQLite: "SCAN projects_job" without "USING ... INDEX".
+POSTGRES_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+SQLITE_FULL_SCAN = re.compile(r'\bSCAN (?:TABLE )?(\w+)(?! USING (?:COVERING )?INDEX)(?!\w)')
+
+
+def hot_queries(owner=None, worker=None):
+    """{name: queryset} for the endpoints that must stay on indexes."""
+    owner = owner or User.objects.filter(role=User.Roles.COMPANY).first()
+    worker = worker or User.objects.filter(role=User.Roles.WORKER).first()
+    job = Job.objects.filter(posted_by=owner).first() if owner else None
+    trade = Trade.objects.first()
+
+    open_jobs = Job.objects.filter(status=Job.Status.OPEN).order_by('-created_at', '-id')
+    queries = {
+        'job list': open_jobs[:10],
+        'job list filtered': open_jobs.filter(
+            trade=trade, location=LOCATIONS[0], type=Job.JobType.JOB
+        )[:10],
+        'login lookup': User.objects.filter(email=f'worker0@{SEED_DOMAIN}', role=User.Roles.WORKER),
+        'verification queue': User.objects.filter(
+            verification_status='pending', role__in=[User.Roles.COMPANY, User.Roles.WORKER]
+        ).order_by('created_at', 'id')[:50],
+    }
+    if worker:
+        queries['my applications'] = Application.objects.filter(applicant=worker).order_by('-created_at', '-id')[:10]
+    if job:
+        queries['applications for owner'] = Application.objects.filter(job=job).order_by('-created_at', '-id')[:10]
+    if owner:
+        queries['my job postings'] = Job.objects.filter(posted_by=owner).order_by('-created_at')[:10]
+    if trade:
+        queries['workers by trade'] = WorkerTrade.objects.filter(trade=trade)[:10]
+    return queries
+
+
+def sequential_scans(queryset):
+    """(core tables read with a sequential scan, plan) for `queryset`."""
+    core_tables = {model._meta.db_table for model in (Job, Application, User, WorkerTrade)}
+    pattern = POSTGRES_SEQ_SCAN if connection.vendor == 'postgresql' else SQLITE_FULL_SCAN
+    plan = queryset.explain()
+    return sorted(core_tables.intersection(pattern.findall(plan))), plan
+
+
+def seed(jobs):
+    """
+    Load `jobs` synthetic jobs with companies, workers, applications and
+    trades so the planner sees realistic sizes. Everything is created with
+    bulk_create, so signal-maintained rollups are not updated.
+    Returns {'owner', 'worker', 'users'}.
+    """
+    rng = random.Random(7)
+    trades = [Trade.objects.get_or_create(name=name)[0] for name in Trade.ChooseTrade.values]
+
+    # Like production, only a small share of accounts awaits verification.
+    def verification_status():
+        return 'pending' if rng.random() < 0.05 else 'approved'
+
+    users = [
+        User(email=f'company{i}@{SEED_DOMAIN}', full_name=f'Company {i}', phone=f'+1{i:09d}',
+             role=User.Roles.COMPANY, password='!', verification_status=verification_status())
+        for i in range(max(1, jobs // 100))
+    ] + [
+        User(email=f'worker{i}@{SEED_DOMAIN}', full_name=f'Worker {i}', phone=f'+2{i:09d}',
+             role=User.Roles.WORKER, password='!', verification_status=verification_status())
+        for i in range(max(1, jobs // 10))
+    ]
+    User.objects.bulk_create(users, batch_size=2000)
+    companies = list(User.objects.filter(email__startswith='company', email__endswith=SEED_DOMAIN))
+    workers = list(User.objects.filter(email__startswith='worker', email__endswith=SEED_DOMAIN))
+
+    for start in range(0, jobs, 5000):
+        Job.objects.bulk_create([
+            Job(
+                posted_by=rng.choice(companies), title=f'Seeded job {start + i}',
+                description='Synthetic job for query plan checks.',
+                location=rng.choice(LOCATIONS), type=rng.choice(Job.JobType.values),
+                trade=rng.choice(trades),
+                status=Job.Status.OPEN if rng.random() < 0.3 else Job.Status.CLOSED,
+            )
+            for i in range(min(5000, jobs - start))
+        ])
+
+    job_ids = list(Job.objects.filter(posted_by__in=companies).values_list('id', flat=True))
+    Application.objects.bulk_create(
+        [
+            Application(job_id=job_id, applicant=worker)
+            for worker in workers
+            for job_id in rng.sample(job_ids, min(5, len(job_ids)))
+        ],
+        batch_size=5000,
+        ignore_conflicts=True,
+    )
+    WorkerTrade.objects.bulk_create(
+        [WorkerTrade(user=worker, trade=rng.choice(trades)) for worker in workers],
+        ignore_conflicts=True,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return {'owner': companies[0], 'worker': workers[0], 'users': len(users)}
@@ -0,0 +1,187 @@
+import logging
+import re
+
+from django.db import DatabaseError, connections
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+SEARCH_CONFIG = 'english'
+FTS_TABLE = f'{Job._meta.db_table}_fts'
+
+# Postgres: a tsvector column on the jobs table kept current by a trigger,
+# with a GIN index. Weighted so title matches rank above location/description.
+POSTGRES_DDL = [
+    "ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('{config}', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('{config}', coalesce(NEW.location, '')), 'B') ||
+            setweight(to_tsvector('{config}', coalesce(NEW.description, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS {table}_search_vector_trg ON {table}",
+    """
+    CREATE TRIGGER {table}_search_vector_trg
+    BEFORE INSERT OR UPDATE OF title, description, location ON {table}
+    FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+    """,
+    "CREATE INDEX IF NOT EXISTS {table}_search_vector_gin ON {table} USING GIN (search_vector)",
+    # Backfill rows that existed before the trigger (fires the trigger).
+    "UPDATE {table} SET title = title WHERE search_vector IS NULL",
+]
+
+# SQLite: an external-content FTS5 table mirrored by triggers.
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+        title, description, location,
+        content='{table}', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+        INSERT INTO {fts}(rowid, title, description, location)
+        VALUES (new.id, new.title, new.description, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+        INSERT INTO {fts}({fts}, rowid, title, description, location)
+        VALUES ('delete', old.id, old.title, old.description, old.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF title, description, location ON {table} BEGIN
+        INSERT INTO {fts}({fts}, rowid, title, description, location)
+        VALUES ('delete', old.id, old.title, old.description, old.location);
+        INSERT INTO {fts}(rowid, title, description, location)
+        VALUES (new.id, new.title, new.description, new.location);
+    END
+    """,
+    # Table rebuilds during migrations drop the triggers; resync the index.
+    "INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+]
+
+_available = {}
+
+
+def install_search_backend(using='default', **kwargs):
+    """
+    Create or refresh the full-text search structures for the jobs table.
+    Connected to post_migrate; safe to run repeatedly.
+    """
+    connection = connections[using]
+    statements = {'postgresql': POSTGRES_DDL, 'sqlite': SQLITE_DDL}.get(connection.vendor)
+    if statements is None:
+        return
+
+    params = {'table': Job._meta.db_table, 'fts': FTS_TABLE, 'config': SEARCH_CONFIG}
+    try:
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement.format(**params))
+    except DatabaseError:
+        # e.g. SQLite compiled without FTS5: searches fall back to ILIKE.
+        logger.warning("Full-text search backend not installed on %s", using, exc_info=True)
+    _available.pop(using, None)
+
+
+def full_text_vendor(using='default'):
+    """Return the vendor whose full-text structures are installed, else None."""
+    if using not in _available:
+        connection = connections[using]
+        table = Job._meta.db_table
+        vendor = None
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    cursor.execute(
+                        "SELECT 1 FROM information_schema.columns "
+                        "WHERE table_name = %s AND column_name = 'search_vector'", [table]
+                    )
+                    vendor = 'postgresql' if cursor.fetchone() else None
+                elif connection.vendor == 'sqlite':
+                    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = %s", [FTS_TABLE])
+                    vendor = 'sqlite' if cursor.fetchone() else None
+        except DatabaseError:
+            vendor = None
+        _available[using] = vendor
+    return _available[using]
+
+
+def search_tokens(text):
+    return [token.lower() for token in TOKEN_RE.findall(text or '')]
+
+
+def full_text_search(queryset, tokens):
+    """
+    Restrict a Job queryset to rows matching every token (prefix match) and
+    annotate it with `search_rank` (higher is better).
+    Returns None when no full-text backend is available for the database.
+    """
+    vendor = full_text_vendor(queryset.db)
+    if vendor is None:
+        return None
+
+    table = connections[queryset.db].ops.quote_name(Job._meta.db_table)
+    if vendor == 'postgresql':
+        query = ' & '.join(f"{token}:*" for token in tokens)
+        match = RawSQL(
+            f"{table}.search_vector @@ to_tsquery('{SEARCH_CONFIG}', %s)", [query],
+            output_field=BooleanField(),
+        )
+        rank = RawSQL(
+            f"ts_rank({table}.search_vector, to_tsquery('{SEARCH_CONFIG}', %s))", [query],
+            output_field=FloatField(),
+        )
+    else:
+        query = ' '.join(f'"{token}"*' for token in tokens)
+        match = RawSQL(
+            f"{table}.id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)", [query],
+            output_field=BooleanField(),
+        )
+        # FTS5 rank is bm25, where more negative means a better match.
+        rank = RawSQL(
+            f"(SELECT -rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id)", [query],
+            output_field=FloatField(),
+        )
+    return queryset.filter(match).annotate(search_rank=rank)
+
+
+class JobSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for SearchFilter on the job list.
+
+    Uses the Postgres tsvector/GIN index or the SQLite FTS5 table and, unless
+    an explicit ?ordering= is given, orders results by relevance. Falls back
+    to SearchFilter's ILIKE behaviour when neither is available. Must come
+    after OrderingFilter in filter_backends so the relevance order sticks.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        tokens = search_tokens(' '.join(terms))
+        if not tokens:
+            return queryset.none()
+
+        searched = full_text_search(queryset, tokens)
+        if searched is None:
+            return super().filter_queryset(request, queryset, view)
+
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            searched = searched.order_by('-search_rank', '-created_at')
+        return searched
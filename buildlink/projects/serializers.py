@@ -1,6 +1,10 @@
 # projects/serializers.py
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 from .models import Job
+from .projections import Projection, DATETIME, MONEY
 from trades.models import Trade
 
 
@@ -25,6 +29,45 @@ class JobListSerializer(serializers.ModelSerializer):
         }
 
 
+# Fast path for the job list; same output as JobListSerializer.
+JOB_LIST_PROJECTION = Projection([
+    Projection.field('id'),
+    Projection.field('title'),
+    Projection.field('location'),
+    Projection.field('type'),
+    Projection.field('trade', 'trade__name', omit_none=True),
+    Projection.field('budget', formatter=MONEY),
+    Projection.field('status'),
+    Projection.field('posted_by', Projection([
+        Projection.field('id', 'posted_by__id'),
+        Projection.field('full_name', 'posted_by__full_name'),
+        Projection.field('role', 'posted_by__role'),
+        Projection.field('email', 'posted_by__email'),
+    ])),
+    Projection.field('created_at', formatter=DATETIME),
+])
+
+
+# Flat rows for the streaming postings export.
+JOB_EXPORT_PROJECTION = Projection([
+    Projection.field('id'),
+    Projection.field('posted_by_id'),
+    Projection.field('title'),
+    Projection.field('description'),
+    Projection.field('location'),
+    Projection.field('type'),
+    Projection.field('trade', 'trade__name'),
+    Projection.field('budget', formatter=MONEY),
+    Projection.field('status'),
+    Projection.field('created_at', formatter=DATETIME),
+    Projection.field('expires_at', formatter=DATETIME),
+    Projection.field('applications_total'),
+    Projection.field('applications_pending'),
+    Projection.field('applications_accepted'),
+    Projection.field('applications_rejected'),
+])
+
+
 class JobDetailSerializer(serializers.ModelSerializer):
     trade = serializers.CharField(source='trade.name', read_only=True)
     posted_by = serializers.SerializerMethodField()
@@ -33,9 +76,9 @@ class JobDetailSerializer(serializers.ModelSerializer):
         model = Job
         fields = [
             'id', 'title', 'description', 'location', 'type',
-            'trade', 'budget', 'status', 'posted_by', 'created_at'
+            'trade', 'budget', 'status', 'posted_by', 'created_at', 'expires_at'
         ]
-        read_only_fields = ['id', 'status', 'posted_by', 'created_at']
+        read_only_fields = ['id', 'status', 'posted_by', 'created_at', 'expires_at']
 
     def get_posted_by(self, obj):
         return {
@@ -48,12 +91,16 @@ class JobDetailSerializer(serializers.ModelSerializer):
 
 class JobCreateUpdateSerializer(serializers.ModelSerializer):
     trade_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
+    auto_close_after = serializers.DurationField(
+        write_only=True, required=False,
+        help_text="Close the job automatically this long after now, e.g. \"14 00:00:00\" for 14 days."
+    )
 
     class Meta:
         model = Job
         fields = [
             'id', 'title', 'description', 'location',
-            'type', 'trade_id', 'budget'
+            'type', 'trade_id', 'budget', 'expires_at', 'auto_close_after'
         ]
         read_only_fields = ['id']
 
@@ -72,6 +119,18 @@ class JobCreateUpdateSerializer(serializers.ModelSerializer):
                 f"Invalid job type. Allowed types: {list(dict(Job.JobType.choices).keys())}"
             )
 
+        auto_close_after = attrs.pop('auto_close_after', None)
+        if auto_close_after is not None:
+            if 'expires_at' in attrs:
+                raise serializers.ValidationError("Provide either expires_at or auto_close_after, not both.")
+            if auto_close_after <= timedelta(0):
+                raise serializers.ValidationError("auto_close_after must be a positive duration.")
+            attrs['expires_at'] = timezone.now() + auto_close_after
+
+        expires_at = attrs.get('expires_at')
+        if expires_at is not None and expires_at <= timezone.now():
+            raise serializers.ValidationError("expires_at must be in the future.")
+
         return attrs
 
     def create(self, validated_data):
@@ -79,16 +138,10 @@ class JobCreateUpdateSerializer(serializers.ModelSerializer):
         request = self.context['request']
         user = request.user
 
-        job = Job.objects.create(posted_by=user, **validated_data)
-
-        if trade_id:
-            try:
-                job.trade = Trade.objects.get(pk=trade_id)
-                job.save()
-            except Trade.DoesNotExist:
-                raise serializers.ValidationError({"trade_id": "Trade not found."})
+        if trade_id and not Trade.objects.filter(pk=trade_id).exists():
+            raise serializers.ValidationError({"trade_id": "Trade not found."})
 
-        return job
+        return Job.objects.create(posted_by=user, trade_id=trade_id or None, **validated_data)
 
     def update(self, instance, validated_data):
         trade_id = validated_data.pop('trade_id', None)
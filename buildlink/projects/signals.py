@@ -0,0 +1,89 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from Users.models import User
+from trades.models import Trade
+from .cache import bump_jobs_version
+from .facets import apply_rollup_deltas, merge_trade_rollups, rollup_deltas
+from .models import Job
+
+# User fields that appear in the job feed (posted_by).
+FEED_USER_FIELDS = {'full_name', 'email', 'role'}
+# Roles allowed to post jobs (projects.permissions.CanCreateJob).
+JOB_POSTER_ROLES = {User.Roles.OWNER, User.Roles.COMPANY}
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=Trade)
+@receiver(post_delete, sender=Trade)
+def invalidate_job_feed(sender, **kwargs):
+    bump_jobs_version()
+
+
+@receiver(pre_save, sender=User)
+def load_feed_user_fields(sender, instance, raw=False, update_fields=None, **kwargs):
+    # New accounts have no jobs yet; logins save last_login only.
+    instance._feed_fields = None
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not FEED_USER_FIELDS & set(update_fields):
+        return
+    instance._feed_fields = User.objects.filter(pk=instance.pk).values(*FEED_USER_FIELDS).first()
+
+
+@receiver(post_save, sender=User)
+def invalidate_job_feed_on_user_change(sender, instance, created, **kwargs):
+    stored, instance._feed_fields = getattr(instance, '_feed_fields', None), None
+    if created or stored is None:
+        return
+    # Only job posters appear in the feed.
+    if stored['role'] not in JOB_POSTER_ROLES and instance.__dict__.get('role') not in JOB_POSTER_ROLES:
+        return
+    if any(name in instance.__dict__ and instance.__dict__[name] != value for name, value in stored.items()):
+        bump_jobs_version()
+
+
+def _touches_rollup(update_fields):
+    if update_fields is None:
+        return True
+    return bool(set(Job.ROLLUP_FIELDS) & {Job._meta.get_field(name).attname for name in update_fields})
+
+
+@receiver(pre_save, sender=Job)
+def load_job_rollup_key(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Instances not loaded through from_db (or loaded with deferred fields)
+    # need their stored bucket fetched before it is overwritten.
+    if raw or instance.pk is None or hasattr(instance, '_rollup_key') or not _touches_rollup(update_fields):
+        return
+    stored = Job.objects.filter(pk=instance.pk).values_list(*Job.ROLLUP_FIELDS).first()
+    if stored is not None:
+        trade_id, job_type, location, job_status = stored
+        instance._rollup_key = (trade_id or 0, job_type, location, job_status)
+
+
+@receiver(post_save, sender=Job)
+def update_job_rollups_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw or not _touches_rollup(update_fields):
+        return
+    new = instance.rollup_key()
+    if created:
+        old_keys = []
+    else:
+        old = getattr(instance, '_rollup_key', None)
+        if old is None or old == new:
+            return
+        old_keys = [old]
+    apply_rollup_deltas(rollup_deltas(old_keys, [new]))
+    instance._rollup_key = new
+
+
+@receiver(post_delete, sender=Job)
+def update_job_rollups_on_delete(sender, instance, **kwargs):
+    key = getattr(instance, '_rollup_key', None) or instance.rollup_key()
+    apply_rollup_deltas({key: -1})
+
+
+@receiver(post_delete, sender=Trade)
+def merge_rollups_of_deleted_trade(sender, instance, **kwargs):
+    merge_trade_rollups(instance.pk)
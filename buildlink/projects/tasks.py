@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+
+from Users.models import User
+from notifications.outbox import enqueue_emails
+
+from .models import Job
+
+CHUNK_SIZE = 1000
+
+
+def _expired_chunk(now, chunk_size):
+    return list(
+        Job.objects.select_for_update(skip_locked=True)
+        .filter(status=Job.Status.OPEN, expires_at__lte=now)
+        .order_by('id')
+        .values_list('id', 'posted_by_id', 'title', 'trade_id', 'type', 'location')[:chunk_size]
+    )
+
+
+def _owner_digests(jobs, rejected_by_job):
+    owner_ids = {job[1] for job in jobs}
+    emails = dict(User.objects.filter(pk__in=owner_ids).values_list('id', 'email'))
+
+    by_owner = defaultdict(list)
+    for job_id, owner_id, title, *_ in jobs:
+        by_owner[owner_id].append((title, rejected_by_job.get(job_id, 0)))
+
+    messages = []
+    for owner_id, closed in by_owner.items():
+        if not emails.get(owner_id):
+            continue
+        lines = [
+            f"- {title} ({rejected} pending application{'s' if rejected != 1 else ''} declined)"
+            for title, rejected in closed
+        ]
+        messages.append({
+            'subject': f"{len(closed)} of your job postings {'was' if len(closed) == 1 else 'were'} closed",
+            'body': (
+                "The following job postings reached their closing date and were closed automatically:\n\n"
+                + "\n".join(lines)
+            ),
+            'recipients': [emails[owner_id]],
+        })
+    return messages
+
+
+@shared_task
+def close_expired_jobs(chunk_size=CHUNK_SIZE):
+    """
+    Close open jobs whose expires_at has passed, reject their pending
+    applications and queue one summary email per owner. Works in chunks of
+    set-based UPDATEs; each chunk commits on its own, and the digests are
+    queued once every chunk is done so an owner spanning chunks gets one.
+    """
+    from applications.services import close_jobs
+
+    now = timezone.now()
+    closed_jobs, rejected_by_job = [], {}
+    while True:
+        with transaction.atomic():
+            jobs = _expired_chunk(now, chunk_size)
+            if not jobs:
+                break
+            rejected_by_job.update(close_jobs([job[:1] + job[3:] for job in jobs], now))
+
+        closed_jobs.extend(jobs)
+        if len(jobs) < chunk_size:
+            break
+
+    if closed_jobs:
+        enqueue_emails(_owner_digests(closed_jobs, rejected_by_job))
+    return len(closed_jobs)
@@ -1,3 +1,175 @@
-from django.test import TestCase
+import datetime
+import shutil
+import tempfile
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from Users.models import User
+from notifications.models import OutboundEmail
+from projects.cache import LOCAL_ONLY_TTL, bump_jobs_version, jobs_version
+from projects.models import Job
+from projects.query_plans import hot_queries, seed, sequential_scans
+from projects.tasks import close_expired_jobs
+
+
+def make_owner(email='owner@example.com', phone='+250700000100'):
+    return User.objects.create_user(email=email, full_name='Owner', phone=phone, role=User.Roles.OWNER)
+
+
+class JobFeedCacheTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        caches['local'].clear()
+        self.job = Job.objects.create(
+            posted_by=make_owner(), title='Tiling', description='Bathroom tiling.',
+            location='Kigali', type=Job.JobType.JOB,
+        )
+        self.url = reverse('projects:job-list-create')
+
+    def titles(self):
+        return [row['title'] for row in self.client.get(self.url).json()['results']]
+
+    def test_briefly_cached_when_default_cache_is_local_memory(self):
+        self.assertEqual(self.titles(), ['Tiling'])
+        # update() does not bump the jobs version, like a write in another worker.
+        Job.objects.filter(pk=self.job.pk).update(title='Plastering')
+        self.assertEqual(self.titles(), ['Tiling'])
+
+        expired = time.time() + LOCAL_ONLY_TTL + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=expired):
+            self.assertEqual(self.titles(), ['Plastering'])
+
+    def test_cached_until_version_bump_when_default_cache_is_shared(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        shared = {
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location},
+            'local': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'projects-tests'},
+        }
+        with override_settings(CACHES=shared):
+            self.addCleanup(caches['local'].clear)
+            self.assertEqual(self.titles(), ['Tiling'])
+            Job.objects.filter(pk=self.job.pk).update(title='Plastering')
+            self.assertEqual(self.titles(), ['Tiling'])
+            bump_jobs_version()
+            self.assertEqual(self.titles(), ['Plastering'])
+
+
+class FeedUserInvalidationTests(TestCase):
+    def assert_bumps(self, expected, action):
+        before = jobs_version()
+        action()
+        self.assertEqual(jobs_version() != before, expected)
+
+    def test_only_feed_changes_of_job_posters_bump(self):
+        owner = make_owner()
+        worker = User.objects.create_user(
+            email='worker@example.com', full_name='Worker', phone='+250700000102', role=User.Roles.WORKER,
+        )
+
+        def rename(user, name):
+            user.full_name = name
+            user.save()
+
+        self.assert_bumps(False, lambda: make_owner('new@example.com', '+250700000103'))
+        self.assert_bumps(False, lambda: rename(worker, 'Worker Renamed'))
+        self.assert_bumps(False, lambda: rename(owner, 'Owner'))
+        self.assert_bumps(False, lambda: owner.save(update_fields=['last_login']))
+        self.assert_bumps(True, lambda: rename(owner, 'Owner Renamed'))
+
+        worker.role = User.Roles.COMPANY
+        self.assert_bumps(True, worker.save)
+
+
+class JobExpiryTests(TestCase):
+    def setUp(self):
+        # Feed counts are cached by SQL, which is now stable across tests.
+        caches['default'].clear()
+        caches['local'].clear()
+        self.owner = make_owner()
+        self.past = timezone.now() - datetime.timedelta(hours=1)
+
+    def make_job(self, title, owner=None, expires_at=None):
+        return Job.objects.create(
+            posted_by=owner or self.owner, title=title, description='Work.',
+            location='Kigali', type=Job.JobType.JOB, expires_at=expires_at,
+        )
+
+    def test_feed_hides_jobs_past_expires_at(self):
+        self.make_job('Open ended')
+        self.make_job('Next week', expires_at=timezone.now() + datetime.timedelta(days=7))
+        self.make_job('Expired', expires_at=self.past)
+
+        response = self.client.get(reverse('projects:job-list-create'))
+        self.assertEqual(sorted(row['title'] for row in response.json()['results']), ['Next week', 'Open ended'])
+
+    def test_facets_agree_with_feed_on_expired_jobs(self):
+        self.make_job('Open ended')
+        self.make_job('Expired', expires_at=self.past)
+        Job.objects.create(
+            posted_by=self.owner, title='Expired elsewhere', description='Work.',
+            location='Huye', type=Job.JobType.JOB, expires_at=self.past,
+        )
+        url = reverse('projects:job-facets')
+
+        for params in ({}, {'search': 'work'}):
+            with self.subTest(params=params):
+                caches['local'].clear()
+                facets = self.client.get(url, params).json()
+                self.assertEqual(facets['total'], 1)
+                self.assertEqual(facets['location'], [{'value': 'Kigali', 'count': 1}])
+
+    def test_feed_count_is_reused_between_requests(self):
+        self.make_job('Open ended')
+        url = reverse('projects:job-list-create')
+        start = timezone.now().replace(second=5)
+        counts = []
+        for offset in (0, 40):
+            caches['local'].clear()  # Only the count may come from cache.
+            with mock.patch('projects.views.timezone.now', return_value=start + datetime.timedelta(seconds=offset)):
+                with CaptureQueriesContext(connection) as queries:
+                    self.assertEqual(self.client.get(url).json()['count'], 1)
+            counts.append(sum('COUNT(' in query['sql'] for query in queries))
+        self.assertEqual(counts, [1, 0])
+
+    def test_one_digest_per_owner_across_chunks(self):
+        other = make_owner('other@example.com', '+250700000101')
+        for i in range(3):
+            self.make_job(f'Expired {i}', expires_at=self.past)
+        self.make_job('Other expired', owner=other, expires_at=self.past)
+        self.make_job('Open ended')
+
+        self.assertEqual(close_expired_jobs(chunk_size=1), 4)
+        self.assertEqual(Job.objects.filter(status=Job.Status.CLOSED).count(), 4)
+        digests = {tuple(email.to): email for email in OutboundEmail.objects.all()}
+        self.assertEqual(set(digests), {('owner@example.com',), ('other@example.com',)})
+        self.assertEqual(digests[('owner@example.com',)].subject, '3 of your job postings were closed')
+        self.assertEqual(digests[('other@example.com',)].subject, '1 of your job postings was closed')
+
+
+class QueryPlanTests(TestCase):
+    """
+    The main query of each hot endpoint must not sequentially scan a core
+    table. Runs on any backend: "Seq Scan" on PostgreSQL, an unindexed
+    "SCAN" in SQLite's EXPLAIN QUERY PLAN.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        # PostgreSQL seq-scans small tables regardless of indexes.
+        cls.seeded = seed(20000 if connection.vendor == 'postgresql' else 2000)
+
+    def test_hot_queries_use_indexes(self):
+        queries = hot_queries(self.seeded['owner'], self.seeded['worker'])
+        self.assertEqual(len(queries), 8)
+        for name, queryset in queries.items():
+            with self.subTest(name):
+                scanned, plan = sequential_scans(queryset)
+                self.assertEqual(scanned, [], plan)
@@ -1,10 +1,13 @@
 # projects/urls.py
 from django.urls import path
-from .views import JobListCreateView, JobRetrieveUpdateDestroyView
+from .views import JobListCreateView, JobFacetsView, JobBulkCreateView, JobExportView, JobRetrieveUpdateDestroyView
 
 app_name = 'projects'
 
 urlpatterns = [
     path('jobs/', JobListCreateView.as_view(), name='job-list-create'),
+    path('jobs/facets/', JobFacetsView.as_view(), name='job-facets'),
+    path('jobs/export/', JobExportView.as_view(), name='job-export'),
+    path('jobs/bulk/', JobBulkCreateView.as_view(), name='job-bulk-create'),
     path('jobs/<int:id>/', JobRetrieveUpdateDestroyView.as_view(), name='job-detail'),
 ]
@@ -1,36 +1,52 @@
 # projects/views.py
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import generics, permissions, filters, status
+from rest_framework.parsers import JSONParser, MultiPartParser
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework.pagination import PageNumberPagination
 from .models import Job
 from .serializers import (
     JobListSerializer,
     JobDetailSerializer,
     JobCreateUpdateSerializer,
-    JobSerializer
+    JobSerializer,
+    JOB_LIST_PROJECTION,
+    JOB_EXPORT_PROJECTION,
 )
 from .permissions import CanCreateJob, IsJobOwner
+from .search import JobSearchFilter
+from .pagination import StandardResultsSetPagination
+from .projections import ProjectionListMixin
+from .cache import job_feed_cache, jobs_version, feed_cache_key, etag_matches
+from .imports import JobImportError, import_jobs, parse_job_rows
+from .facets import facet_counts, job_rows, rollup_rows
+from .exports import export_format, export_response, id_range, int_param
 
 
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'page_size'
-    max_page_size = 50
+def feed_now():
+    # Truncated to the minute so the feed SQL, and with it the cached_count
+    # key, stays stable across requests; a job can linger up to a minute
+    # past expiry.
+    return timezone.now().replace(second=0, microsecond=0)
 
 
 # ----------------------------
 # List and Create Jobs
 # ----------------------------
-class JobListCreateView(generics.ListCreateAPIView):
-    queryset = Job.objects.filter(status=Job.Status.OPEN).select_related('trade', 'posted_by').order_by('-created_at')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+class JobListCreateView(ProjectionListMixin, generics.ListCreateAPIView):
+    queryset = Job.objects.filter(status=Job.Status.OPEN).select_related('trade', 'posted_by').order_by('-created_at', '-id')
+    # JobSearchFilter goes last so relevance ordering survives OrderingFilter.
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, JobSearchFilter]
     filterset_fields = ['trade__id', 'location', 'status', 'type']
     search_fields = ['title', 'description', 'location']
     ordering_fields = ['created_at', 'budget']
-    ordering = ['-created_at']
+    ordering = ['-created_at', '-id']
     pagination_class = StandardResultsSetPagination
+    list_projection = JOB_LIST_PROJECTION
 
     @swagger_auto_schema(tags=["Projects / Jobs"])
     def get(self, request, *args, **kwargs):
@@ -39,6 +55,28 @@ class JobListCreateView(generics.ListCreateAPIView):
         """
         return super().get(request, *args, **kwargs)
 
+    def list(self, request, *args, **kwargs):
+        """
+        Served from a response cache keyed on the jobs version and the
+        normalized query string; only briefly when the default cache is not
+        shared (see TieredResponseCache). Supports ETag / If-None-Match.
+        """
+        key = feed_cache_key(request, jobs_version())
+        entry = job_feed_cache.get(key)
+        if entry is None:
+            response = super().list(request, *args, **kwargs)
+            entry = job_feed_cache.set(key, response.data)
+
+        headers = {'ETag': entry['etag'], 'Cache-Control': 'public, no-cache'}
+        if etag_matches(request, entry['etag']):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(entry['data'], headers=headers)
+
+    def get_queryset(self):
+        # Same rule as applications.services.APPLY_SQL: past expires_at is not
+        # open, even before close_expired_jobs gets to it.
+        return super().get_queryset().filter(Job.unexpired(feed_now()))
+
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return JobCreateUpdateSerializer
@@ -53,6 +91,115 @@ class JobListCreateView(generics.ListCreateAPIView):
         serializer.save()
 
 
+# ----------------------------
+# Facet Counts
+# ----------------------------
+class JobFacetsView(APIView):
+    """
+    Counts per trade, type and location for the job list's current filters
+    (trade__id, type, location, status, search). Each facet ignores its own
+    filter so the UI can show the alternatives. Read from JobRollup unless a
+    search term is given, in which case the matching jobs are grouped.
+    """
+    permission_classes = [permissions.AllowAny]
+    search_fields = JobListCreateView.search_fields
+
+    @swagger_auto_schema(tags=["Projects / Jobs"])
+    def get(self, request):
+        params = request.query_params
+        selected = {}
+        if params.get('trade__id'):
+            try:
+                selected['trade'] = int(params['trade__id'])
+            except ValueError:
+                return Response({"trade__id": "Must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        for dimension in ('type', 'location'):
+            if params.get(dimension):
+                selected[dimension] = params[dimension]
+        job_status = params.get('status') or Job.Status.OPEN
+
+        key = feed_cache_key(request, jobs_version())
+        entry = job_feed_cache.get(key)
+        if entry is None:
+            if job_status != Job.Status.OPEN:
+                # The job list only ever shows open jobs.
+                rows = []
+            elif params.get(api_settings.SEARCH_PARAM):
+                queryset = JobSearchFilter().filter_queryset(
+                    request, Job.objects.filter(Job.unexpired(feed_now()), status=Job.Status.OPEN), self
+                )
+                rows = job_rows(queryset)
+            else:
+                rows = rollup_rows(job_status, feed_now())
+            entry = job_feed_cache.set(key, facet_counts(rows, selected))
+
+        headers = {'ETag': entry['etag'], 'Cache-Control': 'public, no-cache'}
+        if etag_matches(request, entry['etag']):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(entry['data'], headers=headers)
+
+
+# ----------------------------
+# Bulk Job Import
+# ----------------------------
+class JobBulkCreateView(APIView):
+    """
+    Create many jobs at once from a JSON array body or an uploaded CSV/JSON
+    `file`. Valid rows are inserted together; invalid rows are reported by
+    row number and skipped.
+    """
+    permission_classes = [permissions.IsAuthenticated, CanCreateJob]
+    parser_classes = [JSONParser, MultiPartParser]
+
+    @swagger_auto_schema(tags=["Projects / Jobs"], request_body=JobCreateUpdateSerializer(many=True))
+    def post(self, request):
+        upload = request.FILES.get('file')
+        try:
+            if upload is not None:
+                fmt = 'json' if upload.name.lower().endswith('.json') else 'csv'
+                rows = parse_job_rows(upload.read(), fmt)
+            elif isinstance(request.data, list):
+                rows = request.data
+            else:
+                raise JobImportError("Send a JSON array of jobs or upload a CSV/JSON file.")
+        except (JobImportError, UnicodeDecodeError) as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(rows) > settings.JOB_IMPORT_MAX_ROWS:
+            return Response(
+                {"detail": f"At most {settings.JOB_IMPORT_MAX_ROWS} jobs can be imported at once."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        jobs, errors = import_jobs(rows, request.user)
+        return Response(
+            {"created": len(jobs), "ids": [job.pk for job in jobs], "errors": errors},
+            status=status.HTTP_201_CREATED if jobs or not errors else status.HTTP_400_BAD_REQUEST,
+        )
+
+
+# ----------------------------
+# Export Job Postings
+# ----------------------------
+class JobExportView(APIView):
+    """
+    Stream the current user's postings as CSV or NDJSON (?output=csv|ndjson),
+    ordered by id. Admins export every posting, optionally narrowed with
+    ?posted_by=<user id>. Resume an interrupted export with ?after_id=.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(tags=["Projects / Jobs"])
+    def get(self, request):
+        output = export_format(request)
+        jobs = Job.objects.all()
+        if not request.user.is_staff:
+            jobs = jobs.filter(posted_by=request.user)
+        elif int_param(request.query_params, 'posted_by') is not None:
+            jobs = jobs.filter(posted_by_id=int_param(request.query_params, 'posted_by'))
+        return export_response(id_range(jobs, request), JOB_EXPORT_PROJECTION, output, 'jobs')
+
+
 # ----------------------------
 # Retrieve, Update, Delete a Job
 # ----------------------------
@@ -91,6 +238,8 @@ class MyJobPostingsView(generics.ListAPIView):
     """
     serializer_class = JobSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = StandardResultsSetPagination
+    ordering = ['-created_at', '-id']
 
     @swagger_auto_schema(tags=["Projects / Jobs"],
                          operation_summary="List My Job Postings",
@@ -105,7 +254,7 @@ class MyJobPostingsView(generics.ListAPIView):
         """
         if getattr(self, 'swagger_fake_view', False):  # Swagger docs view
             return Job.objects.none()
-        return Job.objects.filter(posted_by=self.request.user)
+        return Job.objects.filter(posted_by=self.request.user).select_related('trade').order_by('-created_at', '-id')
 
     def get_serializer_class(self):
         """
@@ -27,6 +27,10 @@ class WorkerTrade(models.Model):
 
     class Meta:
         unique_together = ('user', 'trade')
+        indexes = [
+            # unique_together covers lookups by user; this one serves "workers with trade X".
+            models.Index(fields=['trade', 'user'], name='workertrade_trade_user_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.trade.name}"
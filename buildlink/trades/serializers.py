@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+
+class WorkerTradesAssignmentSerializer(serializers.Serializer):
+    user_id = serializers.IntegerField()
+    trades = serializers.ListField(child=serializers.CharField(max_length=50), allow_empty=True)
+
+
+class BulkWorkerTradesSerializer(serializers.Serializer):
+    assignments = WorkerTradesAssignmentSerializer(many=True, allow_empty=False, max_length=5000)
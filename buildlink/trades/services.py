@@ -0,0 +1,65 @@
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Trade, WorkerTrade
+
+# Keeps the OR-ed delete for many users to a reasonable statement size.
+USER_CHUNK_SIZE = 500
+
+
+def normalize_trade_names(names):
+    return sorted({name.strip() for name in names if name and name.strip()})
+
+
+def resolve_trade_ids(names):
+    """
+    Map trade names to ids, creating the missing trades.
+    One SELECT, plus one INSERT and one SELECT only when something is new.
+    """
+    names = set(names)
+    if not names:
+        return {}
+    found = dict(Trade.objects.filter(name__in=names).values_list('name', 'id'))
+    missing = names - found.keys()
+    if missing:
+        Trade.objects.bulk_create([Trade(name=name) for name in missing], ignore_conflicts=True)
+        found.update(Trade.objects.filter(name__in=missing).values_list('name', 'id'))
+    return found
+
+
+def bulk_sync_worker_trades(assignments):
+    """
+    Replace the trades of many workers at once.
+
+    `assignments` maps user id -> iterable of trade names. Missing trades and
+    links are inserted with bulk_create(ignore_conflicts=True) and stale links
+    are removed with one DELETE per chunk of users.
+    """
+    normalized = {user_id: normalize_trade_names(names) for user_id, names in assignments.items()}
+    trade_ids = resolve_trade_ids(name for names in normalized.values() for name in names)
+    wanted = {
+        user_id: {trade_ids[name] for name in names}
+        for user_id, names in normalized.items()
+    }
+
+    with transaction.atomic():
+        user_ids = list(wanted)
+        for start in range(0, len(user_ids), USER_CHUNK_SIZE):
+            stale = Q()
+            for user_id in user_ids[start:start + USER_CHUNK_SIZE]:
+                stale |= Q(user_id=user_id) & ~Q(trade_id__in=wanted[user_id])
+            WorkerTrade.objects.filter(stale).delete()
+
+        WorkerTrade.objects.bulk_create(
+            [
+                WorkerTrade(user_id=user_id, trade_id=trade_id)
+                for user_id, ids in wanted.items()
+                for trade_id in ids
+            ],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
+
+
+def sync_worker_trades(user, names):
+    bulk_sync_worker_trades({user.pk: names})
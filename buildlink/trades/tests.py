@@ -1,3 +1,81 @@
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from Users.models import User
+from trades.models import Trade, WorkerTrade
+from trades.services import bulk_sync_worker_trades, sync_worker_trades
+
+
+def make_worker(index):
+    return User.objects.create_user(
+        email=f'worker{index}@example.com', full_name=f'Worker {index}',
+        phone=f'+2507100{index:05d}', role=User.Roles.WORKER,
+    )
+
+
+def trade_names(user):
+    return sorted(WorkerTrade.objects.filter(user=user).values_list('trade__name', flat=True))
+
+
+class SyncWorkerTradesTests(TestCase):
+    def setUp(self):
+        self.workers = [make_worker(i) for i in range(3)]
+        Trade.objects.bulk_create([Trade(name=name) for name in ('plumber', 'painter', 'mason')])
+
+    def test_known_trades_take_a_fixed_number_of_queries(self):
+        sync_worker_trades(self.workers[0], ['plumber'])
+        # SELECT trades, SAVEPOINT, DELETE stale links, INSERT new links, RELEASE.
+        with self.assertNumQueries(5):
+            sync_worker_trades(self.workers[0], ['painter', ' mason ', 'painter'])
+        self.assertEqual(trade_names(self.workers[0]), ['mason', 'painter'])
+
+    def test_new_trades_add_one_insert_and_one_select(self):
+        with self.assertNumQueries(7):
+            sync_worker_trades(self.workers[0], ['roofer', 'tiler', 'plumber'])
+        self.assertEqual(trade_names(self.workers[0]), ['plumber', 'roofer', 'tiler'])
+        self.assertEqual(Trade.objects.count(), 5)
+
+    def test_query_count_does_not_grow_with_workers(self):
+        assignments = {worker.pk: ['plumber', 'painter'] for worker in self.workers}
+        with self.assertNumQueries(5):
+            bulk_sync_worker_trades(assignments)
+
+        assignments[self.workers[1].pk] = []
+        with self.assertNumQueries(5):
+            bulk_sync_worker_trades(assignments)
+        self.assertEqual(trade_names(self.workers[0]), ['painter', 'plumber'])
+        self.assertEqual(trade_names(self.workers[1]), [])
+        self.assertEqual(trade_names(self.workers[2]), ['painter', 'plumber'])
+
+
+class BulkWorkerTradesViewTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email='admin@example.com', full_name='Admin', phone='+250720000000', password='x',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.url = reverse('bulk-worker-trades')
+
+    def post(self, workers):
+        payload = {'assignments': [{'user_id': worker.pk, 'trades': ['plumber', 'mason']} for worker in workers]}
+        payload['assignments'].append({'user_id': self.admin.pk, 'trades': ['plumber']})
+        return self.client.post(self.url, payload, format='json')
+
+    def test_query_count_does_not_grow_with_payload(self):
+        Trade.objects.bulk_create([Trade(name='plumber'), Trade(name='mason')])
+        few, many = [make_worker(i) for i in range(2)], [make_worker(i) for i in range(2, 22)]
+
+        # Worker lookup plus the five queries of bulk_sync_worker_trades.
+        for workers in (few, many):
+            with self.assertNumQueries(6):
+                response = self.post(workers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['updated'], sorted(worker.pk for worker in workers))
+            self.assertEqual(response.data['skipped'], [{'user_id': self.admin.pk, 'detail': 'Worker not found.'}])
+        self.assertEqual(WorkerTrade.objects.count(), 2 * (len(few) + len(many)))
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(make_worker(99))
+        self.assertEqual(self.post([]).status_code, 403)
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import BulkWorkerTradesView
+
+urlpatterns = [
+    path('trades/workers/bulk/', BulkWorkerTradesView.as_view(), name='bulk-worker-trades'),
+]
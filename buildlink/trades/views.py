@@ -1,3 +1,36 @@
-from django.shortcuts import render
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_yasg.utils import swagger_auto_schema
 
-# Create your views here.
+from Users.models import User
+from .serializers import BulkWorkerTradesSerializer
+from .services import bulk_sync_worker_trades
+
+
+class BulkWorkerTradesView(APIView):
+    """
+    Set the trades of many workers in one call (e.g. onboarding agencies).
+    Each worker's trades are replaced by the submitted list.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(tags=["Trades"], request_body=BulkWorkerTradesSerializer)
+    def post(self, request):
+        serializer = BulkWorkerTradesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        assignments = {}
+        for item in serializer.validated_data['assignments']:
+            assignments[item['user_id']] = item['trades']
+
+        workers = set(
+            User.objects.filter(id__in=assignments, role=User.Roles.WORKER).values_list('id', flat=True)
+        )
+        skipped = [user_id for user_id in assignments if user_id not in workers]
+        bulk_sync_worker_trades({user_id: assignments[user_id] for user_id in workers})
+
+        return Response({
+            "updated": sorted(workers),
+            "skipped": [{"user_id": user_id, "detail": "Worker not found."} for user_id in skipped],
+        }, status=status.HTTP_200_OK)